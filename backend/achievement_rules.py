@@ -0,0 +1,137 @@
+"""Compiled achievement rules, indexed by the counter they depend on.
+
+``Achievement.criteria`` is a threshold on one learner counter, written
+``<counter> >= <n>`` (``lessons_completed >= 10``), ``<counter>:<n>``
+(``streak:7``), a one-key dict literal as seeded by ``init_sample_data``
+(``{'daily_streak': 7}``), or one of the legacy names in
+``LEGACY_CRITERIA``.
+Rules are compiled once per content snapshot; an event such as a lesson
+completion only evaluates the rules for the counters it changed, and
+within a counter only the thresholds the new value has reached.
+"""
+import ast
+import re
+from bisect import bisect_right
+from collections import namedtuple
+from types import MappingProxyType
+
+COUNTERS = ('xp', 'level', 'lessons_completed', 'exercises_completed', 'streak', 'quiz_passes')
+
+COUNTER_ALIASES = {
+    'total_xp': 'xp',
+    'current_level': 'level',
+    'lessons': 'lessons_completed',
+    'total_lessons_completed': 'lessons_completed',
+    'exercises': 'exercises_completed',
+    'total_exercises_completed': 'exercises_completed',
+    'daily_streak': 'streak',
+    'quizzes_passed': 'quiz_passes',
+}
+
+LEGACY_CRITERIA = {
+    'first_lesson': ('lessons_completed', 1),
+    'level_5': ('level', 5),
+}
+
+AchievementRule = namedtuple('AchievementRule', ['achievement_id', 'counter', 'threshold', 'xp_reward'])
+
+_CRITERIA = re.compile(r'^\s*([a-z_]+)\s*(?:>=|:)\s*(\d+)\s*$')
+
+
+def parse_criteria(criteria):
+    """Return ``(counter, threshold)`` for ``criteria``, or None if unsupported."""
+    if not criteria:
+        return None
+    text = criteria.strip().lower()
+    if text in LEGACY_CRITERIA:
+        return LEGACY_CRITERIA[text]
+    if text.startswith('{'):
+        return _parse_dict_criteria(text)
+    match = _CRITERIA.match(text)
+    if not match:
+        return None
+    return _threshold(match.group(1), int(match.group(2)))
+
+
+def _parse_dict_criteria(text):
+    try:
+        criteria = ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return None
+    if not isinstance(criteria, dict) or len(criteria) != 1:
+        return None
+    (name, threshold), = criteria.items()
+    if not isinstance(name, str) or not isinstance(threshold, int) or isinstance(threshold, bool):
+        return None
+    return _threshold(name, threshold)
+
+
+def _threshold(name, threshold):
+    counter = COUNTER_ALIASES.get(name, name)
+    if counter not in COUNTERS or threshold < 0:
+        return None
+    return counter, threshold
+
+
+class AchievementRuleSet:
+    """Rules grouped by counter and sorted by threshold.
+
+    Achievements whose criteria don't parse are kept in ``unsupported``
+    and never awarded automatically.
+    """
+
+    def __init__(self, rules, unsupported=()):
+        by_counter = {}
+        for rule in sorted(rules, key=lambda r: (r.threshold, r.achievement_id)):
+            by_counter.setdefault(rule.counter, []).append(rule)
+        self._rules = MappingProxyType({c: tuple(r) for c, r in by_counter.items()})
+        self._thresholds = MappingProxyType({
+            c: tuple(r.threshold for r in rules) for c, rules in self._rules.items()
+        })
+        self.unsupported = tuple(unsupported)
+
+    def __len__(self):
+        return sum(len(rules) for rules in self._rules.values())
+
+    def __iter__(self):
+        for rules in self._rules.values():
+            yield from rules
+
+    def counters(self):
+        return frozenset(self._rules)
+
+    def rules_for(self, counter):
+        return self._rules.get(counter, ())
+
+    def reached(self, counter, value, earned_ids=frozenset()):
+        """Rules on ``counter`` whose threshold ``value`` meets, minus ``earned_ids``."""
+        thresholds = self._thresholds.get(counter)
+        if not thresholds or value is None:
+            return []
+        end = bisect_right(thresholds, value)
+        return [r for r in self._rules[counter][:end] if r.achievement_id not in earned_ids]
+
+    def evaluate(self, counters, earned_ids=frozenset()):
+        """Newly reached rules for ``counters`` (counter name -> current value)."""
+        reached = {}
+        for counter, value in counters.items():
+            for rule in self.reached(counter, value, earned_ids):
+                reached.setdefault(rule.achievement_id, rule)
+        return list(reached.values())
+
+
+def compile_achievement_rules(achievements):
+    rules, unsupported = [], []
+    for achievement in achievements:
+        parsed = parse_criteria(achievement.criteria)
+        if parsed is None:
+            unsupported.append(achievement.id)
+            continue
+        counter, threshold = parsed
+        rules.append(AchievementRule(
+            achievement_id=achievement.id,
+            counter=counter,
+            threshold=threshold,
+            xp_reward=achievement.xp_reward or 0
+        ))
+    return AchievementRuleSet(rules, unsupported)
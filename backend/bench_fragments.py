@@ -0,0 +1,223 @@
+"""Benchmark: per-request dict serialization vs. pre-encoded fragments.
+
+Compares the old /api/units path (build dicts from rows, call to_dict()
+and isoformat() on every lesson and exercise, then encode the whole
+tree) with splicing the snapshot's pre-encoded fragments plus a small
+per-user completion overlay. Runs without a database:
+
+    python bench_fragments.py --units 10 --lessons 8 --exercises 12
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime
+
+from content_snapshot import (
+    build_content_snapshot, splice_fields, splice_raw, join_fragments
+)
+
+
+class FakeDifficulty:
+    value = 'beginner'
+
+
+class FakeExercise:
+    def __init__(self, exercise_id):
+        self.id = exercise_id
+        self.lesson_id = None
+        self.question = f'What is {exercise_id} x 98?'
+        self.correct_answer = str(exercise_id * 98)
+        self.explanation = 'Use Nikhilam: deficits from 100 multiply, cross-subtract.'
+        self.difficulty = FakeDifficulty()
+        self.xp_reward = 10
+        self.question_type = 'calculation'
+        self.options = None
+        self.hints = 'Find how far each number is from 100.'
+        self.step_by_step_solution = 'Step 1 ... Step 2 ... Step 3 ...'
+        self.time_limit = 60
+        self.tags = 'Multiplication, Nikhilam'
+        self.created_at = datetime(2025, 7, 1, 12, 0, 0)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'question': self.question,
+            'correct_answer': self.correct_answer,
+            'explanation': self.explanation,
+            'difficulty': self.difficulty.value,
+            'xp_reward': self.xp_reward,
+            'question_type': self.question_type,
+            'options': self.options,
+            'hints': self.hints,
+            'step_by_step_solution': self.step_by_step_solution,
+            'time_limit': self.time_limit,
+            'tags': self.tags,
+            'created_at': self.created_at.isoformat(),
+        }
+
+
+class FakeLesson:
+    def __init__(self, lesson_id, unit_id, exercises):
+        self.id = lesson_id
+        self.unit_id = unit_id
+        self.title = f'Lesson {lesson_id}'
+        self.description = 'Multiply numbers close to a base using deficits.'
+        self.content_json = {'sections': [{'type': 'technique', 'body': 'x' * 400}] * 4}
+        self.difficulty = 'beginner'
+        self.order_index = lesson_id
+        self.xp_reward = 50
+        self.estimated_time = 15
+        self.is_published = True
+        self.created_at = self.updated_at = datetime(2025, 7, 1, 12, 0, 0)
+        self.exercises = exercises
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'unit_id': self.unit_id,
+            'title': self.title,
+            'description': self.description,
+            'content_json': self.content_json,
+            'difficulty': self.difficulty,
+            'order': self.order_index,
+            'xp_reward': self.xp_reward,
+            'estimated_time': self.estimated_time,
+            'learning_objectives': [],
+            'prerequisites': None,
+            'vedic_sutras': [],
+            'thumbnail_image': None,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+            'is_published': self.is_published,
+            'exercises': [e.to_dict() for e in self.exercises]
+        }
+
+
+class FakeUnit:
+    def __init__(self, unit_id, lessons):
+        self.id = unit_id
+        self.title = f'Unit {unit_id}'
+        self.description = 'Vedic multiplication'
+        self.difficulty = FakeDifficulty()
+        self.color_theme = 'blue'
+        self.order_index = unit_id
+        self.estimated_duration = 60
+        self.lessons = lessons
+
+
+def build_catalog(n_units, n_lessons, n_exercises):
+    units, lessons = [], []
+    exercise_id = lesson_id = 1
+    for unit_id in range(1, n_units + 1):
+        unit_lessons = []
+        for _ in range(n_lessons):
+            exercises = [FakeExercise(exercise_id + i) for i in range(n_exercises)]
+            exercise_id += n_exercises
+            unit_lessons.append(FakeLesson(lesson_id, unit_id, exercises))
+            lesson_id += 1
+        lessons.extend(unit_lessons)
+        units.append(FakeUnit(unit_id, unit_lessons))
+    return units, lessons
+
+
+def dict_units_response(units, completed_ids):
+    result = []
+    for unit in units:
+        completed_lessons = 0
+        lesson_list = []
+        for lesson in unit.lessons:
+            is_completed = lesson.id in completed_ids
+            completed_lessons += is_completed
+            lesson_list.append({
+                "id": lesson.id,
+                "title": lesson.title,
+                "description": lesson.description,
+                "unitId": lesson.unit_id,
+                "contentJson": lesson.content_json,
+                "difficulty": lesson.difficulty,
+                "orderIndex": lesson.order_index,
+                "exercises": [e.to_dict() for e in lesson.exercises],
+                "xpReward": lesson.xp_reward,
+                "duration": lesson.estimated_time,
+                "completed": is_completed
+            })
+        total = len(lesson_list)
+        result.append({
+            "id": unit.id,
+            "title": unit.title,
+            "description": unit.description,
+            "difficulty": unit.difficulty.value,
+            "colorTheme": unit.color_theme or 'blue',
+            "progress": int(completed_lessons / total * 100) if total else 0,
+            "completedLessons": completed_lessons,
+            "totalLessons": total,
+            "lessons": lesson_list,
+            "xpReward": total * 100,
+            "isUnlocked": True
+        })
+    return json.dumps(result, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def fragment_units_response(snapshot, completed_ids):
+    units = []
+    for unit in snapshot.units:
+        completed_lessons = 0
+        lesson_fragments = []
+        for lesson in unit.lessons:
+            is_completed = lesson.id in completed_ids
+            completed_lessons += is_completed
+            lesson_fragments.append(splice_fields(lesson.detail_fragment, completed=is_completed))
+        total = len(lesson_fragments)
+        fragment = splice_fields(
+            unit.fragment,
+            progress=int(completed_lessons / total * 100) if total else 0,
+            completedLessons=completed_lessons
+        )
+        units.append(splice_raw(fragment, 'lessons', join_fragments(lesson_fragments)))
+    return join_fragments(units)
+
+
+def dict_admin_response(lessons):
+    return json.dumps({'lessons': [l.to_dict() for l in lessons]},
+                      separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def fragment_admin_response(snapshot):
+    lessons = sorted(snapshot.lessons.values(), key=lambda l: l.id)
+    return splice_raw(b'{}', 'lessons', join_fragments([l.admin_fragment for l in lessons]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--units', type=int, default=10)
+    parser.add_argument('--lessons', type=int, default=8, help='lessons per unit')
+    parser.add_argument('--exercises', type=int, default=12, help='exercises per lesson')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    units, lessons = build_catalog(args.units, args.lessons, args.exercises)
+    snapshot = build_content_snapshot(1, units, lessons, quizzes=[])
+    completed_ids = {l.id for l in lessons[::3]}
+
+    # Both paths must produce the same document
+    assert json.loads(dict_units_response(units, completed_ids)) == \
+        json.loads(fragment_units_response(snapshot, completed_ids))
+    assert json.loads(dict_admin_response(lessons)) == json.loads(fragment_admin_response(snapshot))
+
+    cases = [
+        ('/api/units', lambda: dict_units_response(units, completed_ids),
+         lambda: fragment_units_response(snapshot, completed_ids)),
+        ('/api/admin/lessons', lambda: dict_admin_response(lessons),
+         lambda: fragment_admin_response(snapshot)),
+    ]
+    print(f'{len(units)} units, {len(lessons)} lessons, '
+          f'{len(lessons) * args.exercises} exercises, {args.repeat} requests each')
+    for name, old, new in cases:
+        old_ms = timeit.timeit(old, number=args.repeat) / args.repeat * 1000
+        new_ms = timeit.timeit(new, number=args.repeat) / args.repeat * 1000
+        print(f'{name:<20} dicts {old_ms:8.3f} ms   fragments {new_ms:8.3f} ms   '
+              f'{old_ms / new_ms:5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Load test: the LLM gateway against a stand-in model with injected faults.
+
+Fires concurrent chat calls at an LLMGateway wrapping StandInModel and
+prints how many were served, shed as busy, refused by the open breaker
+or timed out, along with the gateway's queue and latency metrics. Runs
+without the network:
+
+    python bench_llm_gateway.py --clients 50 --calls 10 --latency 0.3 --error-rate 0.2
+"""
+import argparse
+import json
+import threading
+from collections import Counter
+
+from llm_gateway import LLMGateway, CircuitBreaker, GatewayError, StandInModel
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--calls', type=int, default=10, help='calls per client')
+    parser.add_argument('--latency', type=float, default=0.3)
+    parser.add_argument('--jitter', type=float, default=0.1)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--queue', type=int, default=16)
+    parser.add_argument('--call-timeout', type=float, default=1.0)
+    parser.add_argument('--deadline', type=float, default=2.0)
+    parser.add_argument('--stream', action='store_true')
+    args = parser.parse_args()
+
+    model = StandInModel(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate)
+    gateway = LLMGateway(
+        model, max_concurrency=args.concurrency, queue_size=args.queue, queue_timeout=args.deadline,
+        call_timeout=args.call_timeout, deadline=args.deadline, backoff=0.05,
+        breaker=CircuitBreaker(threshold=5, reset_timeout=1.0)
+    )
+    outcomes = Counter()
+    lock = threading.Lock()
+
+    def client():
+        for _ in range(args.calls):
+            try:
+                if args.stream:
+                    ''.join(gateway.stream('bench'))
+                else:
+                    gateway.generate('bench')
+                outcome = 'served'
+            except GatewayError as e:
+                outcome = type(e).__name__
+            except Exception as e:
+                outcome = f'upstream {type(e).__name__}'
+            with lock:
+                outcomes[outcome] += 1
+
+    threads = [threading.Thread(target=client) for _ in range(args.clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(json.dumps({'outcomes': dict(outcomes), 'gateway': gateway.stats()}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Response cache for the tutor chat.
+
+Messages are normalized (case, whitespace, number formatting and the
+usual ways of writing "times") before hashing, so "What is 98 x 97?"
+and "what is 98*97" share an entry. Keys are namespaced by a hash of the
+system prompt and model name: changing either starts a fresh namespace
+and old entries simply stop matching. Lookups go to a bounded in-memory
+TTL/LRU cache first and then to a persistent store supplied by the
+caller.
+"""
+import hashlib
+import re
+import threading
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+
+from cachetools import TTLCache
+
+CachedReply = namedtuple('CachedReply', ['reply', 'generation_ms'])
+
+_WHITESPACE = re.compile(r'\s+')
+_NUMBER = re.compile(r'\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?')
+_TIMES = re.compile(r'\s*(?:[x×*]|\btimes\b|\bmultiplied by\b)\s*(?=\d)')
+_TRAILING = re.compile(r'[\s?.!]+$')
+
+
+def _normalize_number(match):
+    try:
+        number = Decimal(match.group(0).replace(',', ''))
+    except InvalidOperation:
+        return match.group(0)
+    return format(number.normalize(), 'f')
+
+
+def normalize_message(message):
+    text = _WHITESPACE.sub(' ', (message or '').lower()).strip()
+    text = _NUMBER.sub(_normalize_number, text)
+    text = _TIMES.sub(' x ', text)
+    return _TRAILING.sub('', text)
+
+
+def cache_namespace(system_prompt, model_name):
+    digest = hashlib.sha256(f'{model_name}\n{system_prompt}'.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def cache_key(namespace, message):
+    normalized = normalize_message(message)
+    return hashlib.sha256(f'{namespace}\n{normalized}'.encode('utf-8')).hexdigest(), normalized
+
+
+class ChatResponseCache:
+    """Two-tier cache: in-process TTL/LRU in front of a persistent store.
+
+    ``load(key)`` returns a CachedReply or None (expired entries must come
+    back as None); ``save(key, normalized, reply, generation_ms)`` stores
+    one. Both run in the caller's request.
+    """
+
+    def __init__(self, load, save, maxsize, ttl):
+        self._load = load
+        self._save = save
+        self._memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._metrics = {
+            'memory_hits': 0, 'store_hits': 0, 'misses': 0,
+            'saved_ms': 0, 'generation_ms': 0
+        }
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._metrics[name] += amount
+
+    def get(self, key):
+        with self._lock:
+            cached = self._memory.get(key)
+        if cached is not None:
+            self._count('memory_hits')
+            self._count('saved_ms', cached.generation_ms)
+            return cached.reply
+        cached = self._load(key)
+        if cached is None:
+            self._count('misses')
+            return None
+        with self._lock:
+            self._memory[key] = cached
+        self._count('store_hits')
+        self._count('saved_ms', cached.generation_ms)
+        return cached.reply
+
+    def put(self, key, normalized, reply, generation_ms):
+        cached = CachedReply(reply, int(generation_ms))
+        with self._lock:
+            self._memory[key] = cached
+        self._count('generation_ms', cached.generation_ms)
+        self._save(key, normalized, reply, cached.generation_ms)
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self):
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['memory_entries'] = len(self._memory)
+        lookups = metrics['memory_hits'] + metrics['store_hits'] + metrics['misses']
+        metrics['hit_rate'] = round((lookups - metrics['misses']) / lookups, 4) if lookups else 0
+        return metrics
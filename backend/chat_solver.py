@@ -0,0 +1,350 @@
+"""Local solver for plain arithmetic chat messages.
+
+Messages like "multiply 97 by 96", "square 65" or "complement of 647
+from 1000" have one exact answer, so they don't need the model. The
+classifier only accepts a message that is a bare problem, give or take
+polite filler ("please", "what is", "using vedic maths"). Anything else
+falls through to the model. The solver picks the sutra that suits the
+numbers, works the problem the way the sutra does, and checks the result
+against plain arithmetic. The reply uses the same sections the system
+prompt asks of the model.
+"""
+import re
+from collections import namedtuple
+
+from chat_cache import normalize_message
+
+Solution = namedtuple('Solution', ['technique', 'sutra', 'steps', 'answer', 'explanation'])
+
+SUTRAS = {
+    'nikhilam': 'Nikhilam Navatashcaramam Dashatah ("All from 9 and the last from 10")',
+    'urdhva_tiryak': 'Urdhva-Tiryagbhyam ("Vertically and crosswise")',
+    'ekadhikena_square': 'Ekadhikena Purvena ("By one more than the previous one")',
+    'yavadunam_square': 'Yavadunam ("Whatever the extent of its deficiency")',
+    'complement': 'Nikhilam Navatashcaramam Dashatah ("All from 9 and the last from 10")',
+    'left_to_right_addition': 'Left-to-right addition (Sankalana, place value by place value)',
+}
+
+# Keep worked steps short enough to read in a chat bubble
+MAX_DIGITS = 6
+MAX_TERMS = 6
+
+_FILLER = (
+    r'(?:please|pls|kindly|can you|could you|will you|help me|what is|whats|what\'s|how much is|'
+    r'calculate|compute|find|solve|evaluate|work out|tell me|show me|quickly|'
+    r'(?:using|with|by|in) vedic (?:maths?|mathematics)|for me)'
+)
+_PREFIX = re.compile(rf'^(?:{_FILLER}[\s,:]*)+')
+_SUFFIX = re.compile(rf'(?:[\s,]*{_FILLER})+$')
+
+_N = r'(\d+)'
+_MULTIPLY = [
+    re.compile(rf'multiply {_N} (?:by|and|with|x) {_N}'),
+    re.compile(rf'(?:the )?product of {_N} and {_N}'),
+    re.compile(rf'{_N} x {_N}'),
+]
+_SQUARE = [
+    re.compile(rf'(?:the )?square (?:of )?{_N}'),
+    re.compile(rf'{_N} squared'),
+    re.compile(rf'{_N} ?(?:\^ ?2|²)'),
+]
+_COMPLEMENT = [
+    re.compile(rf'(?:the )?complement of {_N}(?: (?:from|of|to) {_N})?'),
+    re.compile(rf'{_N} ?- ?{_N}'),
+    re.compile(rf'subtract {_N} from {_N}'),
+]
+_ADD = [
+    re.compile(rf'add {_N} (?:and|to|\+) {_N}'),
+    re.compile(rf'(?:the )?sum of {_N} and {_N}'),
+    re.compile(r'(\d+(?: ?\+ ?\d+)+)'),
+]
+
+
+class SolverError(AssertionError):
+    """A sutra's working disagreed with plain arithmetic."""
+
+
+def _verify(technique, worked, expected):
+    if worked != expected:
+        raise SolverError(f'{technique}: worked {worked}, expected {expected}')
+
+
+def _digits(n):
+    return [int(d) for d in str(n)]
+
+
+def _nearest_base(n):
+    """The power of 10 closest to ``n`` (10 at least)."""
+    base = 10
+    while abs(n - base * 10) < abs(n - base):
+        base *= 10
+    return base
+
+
+def _is_power_of_ten(n):
+    return n >= 10 and str(n).strip('0') == '1'
+
+
+def _near_base(base, *numbers):
+    return all(n > 0 and abs(n - base) <= base // 4 for n in numbers)
+
+
+def _combine(left, right, base):
+    """Steps for joining ``left | right`` where the right part has len(base) - 1 digits."""
+    width = len(str(base)) - 1
+    worked = left * base + right
+    if 0 <= right < base:
+        return worked, f'Write {left} followed by {right:0{width}d} (the right part takes {width} digit(s)): {worked}.'
+    if right >= base:
+        carry = right // base
+        return worked, (f'{right} has more than {width} digit(s), so carry {carry} to the left part: '
+                        f'{left} + {carry} = {left + carry}, right part {right % base:0{width}d}, giving {worked}.')
+    borrow = -(right // base)
+    return worked, (f'The right part is negative, so borrow {borrow} from the left part: '
+                    f'{left} - {borrow} = {left - borrow}, right part {base * borrow} - {-right} = '
+                    f'{right + base * borrow:0{width}d}, giving {worked}.')
+
+
+def _deviation(n, base):
+    d = n - base
+    return f'{n} is {abs(d)} {"above" if d > 0 else "below"} {base} (deviation {d:+d})'
+
+
+def nikhilam(a, b):
+    base = _nearest_base(max(a, b))
+    da, db = a - base, b - base
+    left = a + db
+    right = da * db
+    worked, combine = _combine(left, right, base)
+    _verify('nikhilam', worked, a * b)
+    return Solution(
+        technique='nikhilam',
+        sutra=SUTRAS['nikhilam'],
+        steps=[
+            f'Take base {base}: {_deviation(a, base)}; {_deviation(b, base)}.',
+            f'Cross-add: {a} + ({db:+d}) = {left} (or {b} + ({da:+d}) = {left}). This is the left part.',
+            f'Multiply the deviations: ({da:+d}) × ({db:+d}) = {right}. This is the right part.',
+            combine,
+        ],
+        answer=worked,
+        explanation=(f'Both numbers are close to {base}, so the work reduces to one small '
+                     f'multiplication of the deviations instead of a full long multiplication. '
+                     f'It works because (base + x)(base + y) = base × (base + x + y) + x × y.')
+    )
+
+
+def urdhva_tiryak(a, b):
+    da, db = _digits(a)[::-1], _digits(b)[::-1]
+    width = max(len(da), len(db))
+    da += [0] * (width - len(da))
+    db += [0] * (width - len(db))
+
+    steps = [f'Write {a} and {b} one above the other and work the columns from the right.']
+    carry, digits = 0, []
+    for k in range(2 * width - 1):
+        pairs = [(da[i], db[k - i]) for i in range(width) if 0 <= k - i < width]
+        column = sum(x * y for x, y in pairs)
+        total = column + carry
+        products = ' + '.join(f'{x}×{y}' for x, y in pairs)
+        steps.append(f'Column {k + 1}: {products} = {column}' +
+                     (f', plus carry {carry} = {total}' if carry else '') +
+                     f'; write {total % 10}, carry {total // 10}.')
+        digits.append(total % 10)
+        carry = total // 10
+    worked = carry * 10 ** len(digits) + sum(d * 10 ** k for k, d in enumerate(digits))
+    steps.append(f'Bring down the final carry {carry} and read the digits: {worked}.' if carry
+                 else f'Read the digits: {worked}.')
+    _verify('urdhva_tiryak', worked, a * b)
+    return Solution(
+        technique='urdhva_tiryak',
+        sutra=SUTRAS['urdhva_tiryak'],
+        steps=steps,
+        answer=worked,
+        explanation=('Each column collects every pair of digits whose place values multiply to that '
+                     'column, vertically at the ends and crosswise in the middle, so the whole product '
+                     'is written in one line. It works for any numbers, not just those near a base.')
+    )
+
+
+def ekadhikena_square(n):
+    k = n // 10
+    head = k * (k + 1)
+    worked = head * 100 + 25
+    _verify('ekadhikena_square', worked, n * n)
+    return Solution(
+        technique='ekadhikena_square',
+        sutra=SUTRAS['ekadhikena_square'],
+        steps=[
+            f'{n} ends in 5; the part before it is {k}.',
+            f'Multiply {k} by one more than itself: {k} × {k + 1} = {head}.',
+            f'Append 25 (that is, 5 × 5): {worked}.',
+        ],
+        answer=worked,
+        explanation=(f'(10k + 5)² = 100 × k(k + 1) + 25, so any number ending in 5 squares '
+                     f'with one small multiplication.')
+    )
+
+
+def yavadunam_square(n):
+    base = _nearest_base(n)
+    d = n - base
+    left = n + d
+    right = d * d
+    worked, combine = _combine(left, right, base)
+    _verify('yavadunam_square', worked, n * n)
+    return Solution(
+        technique='yavadunam_square',
+        sutra=SUTRAS['yavadunam_square'],
+        steps=[
+            f'Take base {base}: {_deviation(n, base)}.',
+            f'{"Increase" if d > 0 else "Decrease"} {n} by the same amount: {n} + ({d:+d}) = {left}. This is the left part.',
+            f'Square the deviation: ({d:+d})² = {right}. This is the right part.',
+            combine,
+        ],
+        answer=worked,
+        explanation=(f'(base + d)² = base × (base + 2d) + d², and base + 2d is just the number '
+                     f'moved by its deviation again. It is Nikhilam with both factors equal.')
+    )
+
+
+def complement(n, base):
+    digits = _digits(n)
+    width = len(str(base)) - 1
+    digits = [0] * (width - len(digits)) + digits
+    zeros = len(digits) - len(''.join(map(str, digits)).rstrip('0'))
+    significant = digits[:len(digits) - zeros]
+    worked_digits = [9 - d for d in significant[:-1]] + [10 - significant[-1]] + [0] * zeros
+    worked = int(''.join(str(d) for d in worked_digits))
+    _verify('complement', worked, base - n)
+
+    steps = [f'Write {n} with {width} digit(s) to match {base}: {"".join(map(str, digits))}.']
+    if significant[:-1]:
+        steps.append('All from 9: ' + ', '.join(f'9 - {d} = {9 - d}' for d in significant[:-1]) + '.')
+    steps.append(f'The last from 10: 10 - {significant[-1]} = {10 - significant[-1]}.')
+    if zeros:
+        steps.append(f'The {zeros} trailing zero(s) stay as zeros.')
+    steps.append(f'Read the digits: {worked}.')
+    return Solution(
+        technique='complement',
+        sutra=SUTRAS['complement'],
+        steps=steps,
+        answer=worked,
+        explanation=(f'{base} - 1 is all nines, and subtracting from 9 never borrows; adding the 1 '
+                     f'back lands on the last non-zero digit, which is why it comes from 10.')
+    )
+
+
+def left_to_right_addition(numbers):
+    width = max(len(str(n)) for n in numbers)
+    running, steps = 0, []
+    for place in range(width - 1, -1, -1):
+        unit = 10 ** place
+        column = [(n // unit) % 10 for n in numbers]
+        part = sum(column) * unit
+        running += part
+        steps.append(f'{" + ".join(map(str, column))} in the {unit}s place = {part}; running total {running}.')
+    _verify('left_to_right_addition', running, sum(numbers))
+    return Solution(
+        technique='left_to_right_addition',
+        sutra=SUTRAS['left_to_right_addition'],
+        steps=steps,
+        answer=running,
+        explanation=('Adding from the largest place value first gives a good estimate straight away '
+                     'and only ever adjusts the running total, which is easier to hold in your head '
+                     'than carries from the right.')
+    )
+
+
+def multiply(a, b):
+    if a == b:
+        return square(a)
+    base = _nearest_base(max(a, b))
+    if _near_base(base, a, b):
+        return nikhilam(a, b)
+    return urdhva_tiryak(a, b)
+
+
+def square(n):
+    if n % 10 == 5:
+        return ekadhikena_square(n)
+    if _near_base(_nearest_base(n), n):
+        return yavadunam_square(n)
+    return urdhva_tiryak(n, n)
+
+
+def _match(patterns, problem):
+    for pattern in patterns:
+        match = pattern.fullmatch(problem)
+        if match:
+            return match
+    return None
+
+
+def classify(message):
+    """The bare problem in ``message`` as ``(operation, numbers)``, or None."""
+    problem = normalize_message(message)
+    problem = _SUFFIX.sub('', _PREFIX.sub('', problem)).strip()
+
+    match = _match(_MULTIPLY, problem)
+    if match:
+        return 'multiply', [int(g) for g in match.groups()]
+    match = _match(_SQUARE, problem)
+    if match:
+        return 'square', [int(match.group(1))]
+    match = _match(_COMPLEMENT, problem)
+    if match:
+        a, b = match.groups()
+        if match.re is _COMPLEMENT[0]:
+            n = int(a)
+            base = int(b) if b else 10 ** len(str(n))
+        elif match.re is _COMPLEMENT[1]:
+            base, n = int(a), int(b)
+        else:
+            n, base = int(a), int(b)
+        if not _is_power_of_ten(base):
+            return None
+        return 'complement', [n, base]
+    match = _match(_ADD, problem)
+    if match:
+        if match.lastindex == 1:
+            return 'add', [int(t) for t in re.split(r' ?\+ ?', match.group(1))]
+        return 'add', [int(g) for g in match.groups()]
+    return None
+
+
+def solve(message):
+    """A worked Solution for a bare arithmetic ``message``, or None."""
+    problem = classify(message)
+    if problem is None:
+        return None
+    operation, numbers = problem
+    if any(len(str(n)) > MAX_DIGITS for n in numbers):
+        return None
+    if operation == 'multiply':
+        a, b = numbers
+        if a == 0 or b == 0:
+            return None
+        return multiply(a, b)
+    if operation == 'square':
+        return square(numbers[0]) if numbers[0] else None
+    if operation == 'complement':
+        n, base = numbers
+        if not 0 < n < base:
+            return None
+        return complement(n, base)
+    if operation == 'add':
+        if len(numbers) > MAX_TERMS:
+            return None
+        return left_to_right_addition(numbers)
+    return None
+
+
+def render(solution):
+    """``solution`` in the 📌/📝/✅/💡 layout the system prompt asks for."""
+    steps = '\n'.join(f'{i}. {step}' for i, step in enumerate(solution.steps, 1))
+    return (
+        f'📌 **Concept / Sutra Used**: {solution.sutra}\n\n'
+        f'📝 **Step-by-Step Solution**:\n{steps}\n\n'
+        f'✅ **Final Answer**: {solution.answer}\n\n'
+        f'💡 **Quick Explanation**: {solution.explanation}'
+    )
@@ -0,0 +1,53 @@
+"""Server-Sent Events framing for streamed chat replies.
+
+Kept apart from the Flask route so the frame sequence (chunks, then
+``done`` or ``error``) and disconnect handling can be exercised against
+a fake model without the app.
+"""
+import json
+import logging
+
+from llm_gateway import GatewayError
+
+logger = logging.getLogger(__name__)
+
+
+def sse_event(payload, event=None):
+    """One Server-Sent Events frame carrying ``payload`` as JSON."""
+    frame = f"event: {event}\n" if event else ""
+    return f"{frame}data: {json.dumps(payload)}\n\n"
+
+
+def relay_chat_stream(open_stream, done=dict, on_complete=None):
+    """SSE frames relaying the text chunks of ``open_stream()``.
+
+    A comment frame goes out first so headers flush before the model
+    answers, then one ``{"text": ...}`` frame per chunk and a ``done``
+    event whose payload ``done()`` supplies. A failure ends the stream
+    with an ``error`` event instead. ``on_complete(reply)`` runs after the
+    ``done`` frame has been sent, for complete replies only. Closing this
+    generator (the client went away) closes the chunk stream, which is
+    how the upstream call gets cancelled rather than drained.
+    """
+    chunks = None
+    parts = []
+    try:
+        yield ": connected\n\n"
+        chunks = open_stream()
+        for text in chunks:
+            parts.append(text)
+            yield sse_event({"text": text})
+        yield sse_event(dict(done(), done=True), event="done")
+    except GatewayError as e:
+        yield sse_event({"error": str(e), "retryAfter": e.retry_after}, event="error")
+        return
+    except Exception as e:
+        logger.exception("Chat stream failed")
+        yield sse_event({"error": str(e)}, event="error")
+        return
+    finally:
+        if chunks is not None and hasattr(chunks, 'close'):
+            chunks.close()
+
+    if parts and on_complete is not None:
+        on_complete("".join(parts))
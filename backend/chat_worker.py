@@ -0,0 +1,286 @@
+"""Chat worker pool: runs the chat model outside the web processes.
+
+The web app never imports ``google.generativeai``, grpc or protobuf. It
+talks to this sidecar over a local socket through ``ChatWorkerClient``,
+which has the same ``generate_content`` shape as
+``genai.GenerativeModel``, so ``LLMGateway`` wraps either one unchanged.
+The worker's own ``--workers`` limit sizes the pool regardless of how
+many web processes share it.
+
+Run next to the app:
+
+    python chat_worker.py --address localhost:7000 --workers 4
+    python chat_worker.py --address unix:/tmp/vedic-chat.sock --backend standin --error-rate 0.1
+
+The protocol is one JSON request line per connection,
+``{"prompt", "stream", "timeout"}``, answered by ``{"text"}`` lines and
+then a ``{"done"}`` line or an ``{"error", "code"}`` line. A worker with
+no free slot answers ``{"error", "busy": true}`` instead. The client
+raises that as GatewayBusy, which the gateway neither retries nor counts
+against upstream health.
+"""
+import argparse
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+
+from llm_gateway import GatewayBusy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = 'gemini-1.5-flash'
+MAX_REQUEST_BYTES = 1 << 20
+
+
+class ChatWorkerError(Exception):
+    """The model failed inside the worker; ``code`` is its HTTP status, if any."""
+
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code
+
+
+def parse_address(address):
+    """``unix:/path`` or ``host:port`` -> (socket family, bind/connect address)."""
+    if address.startswith('unix:'):
+        return socket.AF_UNIX, address[len('unix:'):]
+    host, _, port = address.rpartition(':')
+    return socket.AF_INET, (host or 'localhost', int(port))
+
+
+def cancel_stream(stream):
+    """Stop a streaming model call nobody is reading any more."""
+    # Gemini's streaming response wraps a gRPC/HTTP iterator; cancelling
+    # it tears down the upstream request instead of draining it.
+    for target in (stream, getattr(stream, '_iterator', None)):
+        for name in ('cancel', 'close'):
+            method = getattr(target, name, None)
+            if callable(method):
+                try:
+                    method()
+                except Exception:
+                    logger.exception('Cancelling chat stream failed')
+                return
+
+
+def _error_code(exc):
+    if isinstance(exc, TimeoutError):
+        return 504
+    code = getattr(exc, 'code', None)
+    return int(code) if isinstance(code, int) else None
+
+
+# Client side, imported by the web app
+
+class WorkerChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class WorkerStream:
+    """Reply chunks read off a worker connection; ``cancel`` hangs up."""
+
+    def __init__(self, sock):
+        self._sock = sock
+        self._lines = sock.makefile('rb')
+
+    def __iter__(self):
+        try:
+            for line in self._lines:
+                message = json.loads(line)
+                if 'text' in message:
+                    yield WorkerChunk(message['text'])
+                elif message.get('busy'):
+                    raise GatewayBusy(message.get('error') or 'Chat workers are busy', retry_after=1)
+                elif 'error' in message:
+                    raise ChatWorkerError(message['error'], message.get('code'))
+                elif message.get('done'):
+                    return
+            raise ConnectionError('Chat worker closed the connection')
+        except socket.timeout as e:
+            raise TimeoutError('Chat worker timed out') from e
+        finally:
+            self.cancel()
+
+    def cancel(self):
+        self._lines.close()
+        self._sock.close()
+
+
+class ChatWorkerClient:
+    """Stands in for ``genai.GenerativeModel``; each call is one connection."""
+
+    def __init__(self, address, connect_timeout=1.0):
+        self.address = address
+        self.connect_timeout = connect_timeout
+        self._family, self._target = parse_address(address)
+
+    def _connect(self, timeout):
+        sock = socket.socket(self._family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.connect_timeout)
+            sock.connect(self._target)
+        except socket.timeout as e:
+            sock.close()
+            raise TimeoutError(f'Chat worker at {self.address} did not answer') from e
+        except OSError as e:
+            sock.close()
+            raise ConnectionError(f'Chat worker at {self.address} is unreachable: {e}') from e
+        sock.settimeout(timeout)
+        return sock
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        timeout = (request_options or {}).get('timeout')
+        sock = self._connect(timeout)
+        try:
+            request = {'prompt': prompt, 'stream': stream, 'timeout': timeout}
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        except socket.timeout as e:
+            sock.close()
+            raise TimeoutError('Chat worker timed out') from e
+        except OSError as e:
+            sock.close()
+            raise ConnectionError(f'Chat worker at {self.address} dropped the request: {e}') from e
+        reply = WorkerStream(sock)
+        if stream:
+            return reply
+        return WorkerChunk(''.join(chunk.text for chunk in reply))
+
+
+# Worker side
+
+class ChatRequestHandler(socketserver.StreamRequestHandler):
+    def send(self, message):
+        self.wfile.write(json.dumps(message).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline(MAX_REQUEST_BYTES))
+            prompt = request['prompt']
+        except (ValueError, KeyError, TypeError):
+            self.send({'error': 'Malformed chat request', 'code': 400})
+            return
+        timeout = request.get('timeout')
+        started = time.monotonic()
+        # Answer "busy" well before the caller's socket gives up on us
+        wait = self.server.slot_timeout if timeout is None else min(self.server.slot_timeout, timeout / 2)
+        if not self.server.slots.acquire(timeout=wait):
+            self.send({'error': 'Chat workers are busy', 'busy': True})
+            return
+        try:
+            if timeout is not None:
+                # The caller's clock started before the wait for a slot
+                timeout -= time.monotonic() - started
+                if timeout <= 0:
+                    self.send({'error': 'Chat workers are busy', 'busy': True})
+                    return
+            self.generate(prompt, bool(request.get('stream')), timeout)
+        finally:
+            self.server.slots.release()
+
+    def generate(self, prompt, stream, timeout):
+        options = {'request_options': {'timeout': timeout}} if timeout is not None else {}
+        upstream = None
+        try:
+            if stream:
+                upstream = self.server.model.generate_content(prompt, stream=True, **options)
+                for chunk in upstream:
+                    text = getattr(chunk, 'text', '')
+                    if text:
+                        self.send({'text': text})
+            else:
+                response = self.server.model.generate_content(prompt, **options)
+                self.send({'text': response.text if response else ''})
+            self.send({'done': True})
+        except (BrokenPipeError, ConnectionResetError):
+            # The web worker hung up (client disconnect or timeout)
+            if upstream is not None:
+                cancel_stream(upstream)
+        except Exception as e:
+            logger.exception('Chat generation failed')
+            try:
+                self.send({'error': str(e), 'code': _error_code(e)})
+            except OSError:
+                pass
+
+
+class _PoolMixin:
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, target, model, workers, slot_timeout):
+        self.model = model
+        self.slots = threading.BoundedSemaphore(workers)
+        self.slot_timeout = slot_timeout
+        super().__init__(target, ChatRequestHandler)
+
+
+class TCPChatServer(_PoolMixin, socketserver.ThreadingTCPServer):
+    pass
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    class UnixChatServer(_PoolMixin, socketserver.ThreadingUnixStreamServer):
+        pass
+
+
+def make_server(address, model, workers=4, slot_timeout=1.0):
+    """A server for ``model`` on ``address``; call ``serve_forever`` to run it.
+
+    A request waits at most ``slot_timeout`` seconds (or half its own
+    timeout, if shorter) for one of the ``workers`` slots.
+    """
+    family, target = parse_address(address)
+    if family == socket.AF_UNIX:
+        if os.path.exists(target):
+            os.unlink(target)
+        return UnixChatServer(target, model, workers, slot_timeout)
+    return TCPChatServer(target, model, workers, slot_timeout)
+
+
+def gemini_model(model_name, api_key):
+    # Only the worker pays for the Gemini client (grpc, protobuf)
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--address', default=os.environ.get('CHAT_WORKER_ADDRESS', 'localhost:7000'))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('CHAT_WORKERS', 4)))
+    parser.add_argument('--slot-timeout', type=float, default=1.0,
+                        help='seconds a request may wait for a free worker before "busy"')
+    parser.add_argument('--model', default=os.environ.get('CHAT_MODEL_NAME', DEFAULT_MODEL_NAME))
+    parser.add_argument('--backend', choices=('gemini', 'standin'), default='gemini')
+    parser.add_argument('--latency', type=float, default=0.5, help='standin backend only')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='standin backend only')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.backend == 'standin':
+        from llm_gateway import StandInModel
+        model = StandInModel(latency=args.latency, jitter=args.latency / 2, error_rate=args.error_rate)
+    else:
+        api_key = os.environ.get('GEMINI_API_KEY')
+        if not api_key:
+            parser.error('GEMINI_API_KEY is not set (use --backend standin to run without Gemini)')
+        model = gemini_model(args.model, api_key)
+
+    server = make_server(args.address, model, args.workers, args.slot_timeout)
+    logger.info('Chat worker (%s, %d workers) listening on %s', args.backend, args.workers, args.address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
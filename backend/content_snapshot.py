@@ -0,0 +1,229 @@
+"""In-process snapshot of the published curriculum.
+
+The snapshot is built once from the content tables into tuples and
+namedtuples and then only ever replaced, never mutated, so request
+handlers can read it without locks. Units, lessons and exercises also
+carry pre-encoded JSON fragments that handlers splice into responses,
+adding user-specific fields as small overlays. Each snapshot carries the content
+version it was built from (see ``ContentVersion`` in app.py); a reader
+that sees a newer version in the database rebuilds it, and concurrent
+readers share that single rebuild.
+"""
+import json
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+from achievement_rules import compile_achievement_rules
+from drill_sampler import DrillIndex
+from quiz_grading import build_answer_key
+
+
+UnitRecord = namedtuple('UnitRecord', [
+    'id', 'title', 'description', 'difficulty', 'color_theme',
+    'order_index', 'estimated_duration', 'lessons', 'fragment'
+])
+
+LessonRecord = namedtuple('LessonRecord', [
+    'id', 'unit_id', 'title', 'description', 'content_json', 'difficulty',
+    'order_index', 'xp_reward', 'estimated_time', 'is_published', 'exercises',
+    'summary_fragment', 'detail_fragment', 'admin_fragment'
+])
+
+QuizRecord = namedtuple('QuizRecord', [
+    'id', 'lesson_id', 'title', 'description', 'time_limit',
+    'max_attempts', 'passing_score', 'xp_reward', 'questions', 'answer_key'
+])
+
+ContentSnapshot = namedtuple('ContentSnapshot', [
+    'version', 'units', 'lessons', 'quizzes', 'achievement_rules', 'drill'
+])
+ContentSnapshot.__doc__ = """Immutable view of the curriculum.
+
+``units`` is ordered by ``order_index``; ``lessons`` and ``quizzes`` are
+read-only mappings keyed by id. Exercise and question payloads are
+stored already serialized and must be treated as read-only. Question
+payloads carry no answers; those live in each quiz's ``answer_key``.
+``achievement_rules`` is the compiled AchievementRuleSet and ``drill``
+the DrillIndex over every exercise, including ones with no lesson.
+"""
+
+
+def encode_fragment(payload):
+    return json.dumps(payload, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def splice_fields(fragment, **fields):
+    """Add top-level ``fields`` to an encoded JSON object."""
+    if not fields:
+        return fragment
+    extra = encode_fragment(fields)
+    if fragment == b'{}':
+        return extra
+    return fragment[:-1] + b',' + extra[1:]
+
+
+def splice_raw(fragment, key, raw):
+    """Add ``key`` to an encoded JSON object with an already encoded value."""
+    prefix = b'{' if fragment == b'{}' else fragment[:-1] + b','
+    return prefix + json.dumps(key).encode('utf-8') + b':' + raw + b'}'
+
+
+def join_fragments(fragments):
+    return b'[' + b','.join(fragments) + b']'
+
+
+def serialize_quiz_question(question):
+    return {
+        "id": question.id,
+        "question": question.question,
+        "question_type": question.question_type,
+        "options": question.options.split("\n") if question.options else [],
+        "points": question.points
+    }
+
+
+def build_content_snapshot(version, units, lessons, quizzes, achievements=(), drill_exercises=None):
+    """Build a ContentSnapshot from ORM rows (or anything shaped like them).
+
+    ``drill_exercises`` defaults to the exercises attached to ``lessons``.
+    """
+    lesson_records = {}
+    lessons_by_unit = {}
+    for lesson in sorted(lessons, key=lambda l: (l.order_index, l.id)):
+        exercises = tuple(e.to_dict() for e in sorted(lesson.exercises, key=lambda e: e.id))
+        exercises_fragment = join_fragments([encode_fragment(e) for e in exercises])
+        summary = {
+            "id": lesson.id,
+            "title": lesson.title,
+            "description": lesson.description,
+            "difficulty": lesson.difficulty,
+            "orderIndex": lesson.order_index,
+            "xpReward": lesson.xp_reward,
+            "duration": lesson.estimated_time
+        }
+        detail = dict(summary, unitId=lesson.unit_id, contentJson=lesson.content_json)
+        admin = lesson.to_dict()
+        admin.pop('exercises', None)
+
+        record = LessonRecord(
+            id=lesson.id,
+            unit_id=lesson.unit_id,
+            title=lesson.title,
+            description=lesson.description,
+            content_json=lesson.content_json,
+            difficulty=lesson.difficulty,
+            order_index=lesson.order_index,
+            xp_reward=lesson.xp_reward,
+            estimated_time=lesson.estimated_time,
+            is_published=bool(lesson.is_published),
+            exercises=exercises,
+            summary_fragment=encode_fragment(summary),
+            detail_fragment=splice_raw(encode_fragment(detail), 'exercises', exercises_fragment),
+            admin_fragment=splice_raw(encode_fragment(admin), 'exercises', exercises_fragment)
+        )
+        lesson_records[record.id] = record
+        lessons_by_unit.setdefault(record.unit_id, []).append(record)
+
+    unit_records = []
+    for unit in sorted(units, key=lambda u: (u.order_index, u.id)):
+        unit_lessons = tuple(lessons_by_unit.get(unit.id, ()))
+        difficulty = unit.difficulty.value if unit.difficulty else None
+        unit_records.append(UnitRecord(
+            id=unit.id,
+            title=unit.title,
+            description=unit.description,
+            difficulty=difficulty,
+            color_theme=unit.color_theme,
+            order_index=unit.order_index,
+            estimated_duration=unit.estimated_duration,
+            lessons=unit_lessons,
+            fragment=encode_fragment({
+                "id": unit.id,
+                "title": unit.title,
+                "description": unit.description,
+                "difficulty": difficulty,
+                "colorTheme": unit.color_theme or 'blue',
+                "totalLessons": len(unit_lessons),
+                "xpReward": len(unit_lessons) * 100,
+                "isUnlocked": True
+            })
+        ))
+
+    quiz_records = {}
+    for quiz in sorted(quizzes, key=lambda q: q.id):
+        questions = sorted(quiz.questions, key=lambda q: (q.order_index, q.id))
+        quiz_records[quiz.id] = QuizRecord(
+            id=quiz.id,
+            lesson_id=quiz.lesson_id,
+            title=quiz.title,
+            description=quiz.description,
+            time_limit=quiz.time_limit,
+            max_attempts=quiz.max_attempts,
+            passing_score=quiz.passing_score,
+            xp_reward=quiz.xp_reward,
+            questions=tuple(serialize_quiz_question(q) for q in questions),
+            answer_key=MappingProxyType({q.id: build_answer_key(q) for q in questions})
+        )
+
+    return ContentSnapshot(
+        version=version,
+        units=tuple(unit_records),
+        lessons=MappingProxyType(lesson_records),
+        quizzes=MappingProxyType(quiz_records),
+        achievement_rules=compile_achievement_rules(achievements),
+        drill=DrillIndex(
+            drill_exercises if drill_exercises is not None
+            else [e for l in lessons for e in l.exercises]
+        )
+    )
+
+
+class ContentSnapshotStore:
+    """Holds the current snapshot and rebuilds it single-flight.
+
+    ``loader`` is called with no arguments and must return a fresh
+    ContentSnapshot; it runs under a lock so only one thread rebuilds
+    at a time while the others wait and reuse its result.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._stale = False
+
+    @property
+    def is_stale(self):
+        return self._stale
+
+    def get(self, min_version):
+        """Return a snapshot at least as new as ``min_version``."""
+        snapshot = self._snapshot
+        if snapshot is not None and not self._stale and snapshot.version >= min_version:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or self._stale or snapshot.version < min_version:
+                snapshot = self._rebuild()
+        return snapshot
+
+    def refresh(self):
+        """Rebuild now, e.g. at startup or right after an admin write."""
+        with self._lock:
+            return self._rebuild()
+
+    def mark_stale(self):
+        self._stale = True
+
+    def _rebuild(self):
+        self._stale = False
+        try:
+            snapshot = self._loader()
+        except Exception:
+            self._stale = True
+            raise
+        # Single reference assignment, so readers see the old or the new
+        # snapshot and never a partially built one.
+        self._snapshot = snapshot
+        return snapshot
@@ -0,0 +1,117 @@
+"""Random exercise sampling for quick drills.
+
+The index keeps exercise ids in tuples per difficulty, tag and lesson,
+built once per content snapshot. A drill samples from the smallest pool
+matching its filters with a lazy Fisher-Yates shuffle: only the
+positions actually drawn are swapped, so a draw costs O(k) rather than
+copying or sorting the pool. Drill payloads carry no answers; answers
+are checked server-side against ``answer_keys``.
+"""
+import random
+from collections import namedtuple
+from types import MappingProxyType
+
+from quiz_grading import AnswerKey, normalize_answer
+
+DrillExercise = namedtuple('DrillExercise', ['id', 'lesson_id', 'difficulty', 'tags', 'payload'])
+
+
+def parse_tags(tags):
+    if not tags:
+        return frozenset()
+    return frozenset(t.strip().lower() for t in tags.split(',') if t.strip())
+
+
+def build_drill_answer_key(exercise):
+    # Exercises have no per-question points; a drill answer is worth its XP
+    return AnswerKey(
+        answer=normalize_answer(exercise.correct_answer),
+        points=exercise.xp_reward or 0,
+        correct_answer=exercise.correct_answer,
+        explanation=exercise.explanation
+    )
+
+
+def serialize_drill_exercise(exercise):
+    return {
+        'id': exercise.id,
+        'question': exercise.question,
+        'difficulty': exercise.difficulty.value if exercise.difficulty else None,
+        'question_type': exercise.question_type,
+        'options': exercise.options.split('\n') if exercise.options else [],
+        'hints': exercise.hints,
+        'time_limit': exercise.time_limit,
+        'xp_reward': exercise.xp_reward,
+        'tags': exercise.tags
+    }
+
+
+class DrillIndex:
+    def __init__(self, exercises):
+        records, answer_keys = {}, {}
+        by_difficulty, by_tag, by_lesson = {}, {}, {}
+        for exercise in sorted(exercises, key=lambda e: e.id):
+            record = DrillExercise(
+                id=exercise.id,
+                lesson_id=exercise.lesson_id,
+                difficulty=exercise.difficulty.value if exercise.difficulty else None,
+                tags=parse_tags(exercise.tags),
+                payload=serialize_drill_exercise(exercise)
+            )
+            records[record.id] = record
+            answer_keys[record.id] = build_drill_answer_key(exercise)
+            by_difficulty.setdefault(record.difficulty, []).append(record.id)
+            by_lesson.setdefault(record.lesson_id, []).append(record.id)
+            for tag in record.tags:
+                by_tag.setdefault(tag, []).append(record.id)
+
+        self.records = MappingProxyType(records)
+        self.answer_keys = MappingProxyType(answer_keys)
+        self._all = tuple(records)
+        self._by_difficulty = {k: tuple(v) for k, v in by_difficulty.items()}
+        self._by_tag = {k: tuple(v) for k, v in by_tag.items()}
+        self._by_lesson = {k: tuple(v) for k, v in by_lesson.items()}
+
+    def __len__(self):
+        return len(self._all)
+
+    def sample(self, k, difficulty=None, tags=(), lesson_id=None, exclude=frozenset(), rng=random):
+        """Up to ``k`` distinct exercises matching every filter, in random order.
+
+        ``tags`` matches exercises having all of the given tags. Ids in
+        ``exclude`` are skipped unless that leaves fewer than ``k``
+        matches, in which case excluded exercises fill the remainder.
+        """
+        tags = frozenset(t.lower() for t in tags)
+        pools = [self._all]
+        if difficulty is not None:
+            pools.append(self._by_difficulty.get(difficulty, ()))
+        if lesson_id is not None:
+            pools.append(self._by_lesson.get(lesson_id, ()))
+        pools.extend(self._by_tag.get(tag, ()) for tag in tags)
+        pool = min(pools, key=len)
+
+        def matches(record):
+            return (
+                (difficulty is None or record.difficulty == difficulty)
+                and (lesson_id is None or record.lesson_id == lesson_id)
+                and tags <= record.tags
+            )
+
+        picked, excluded = [], []
+        swapped = {}  # lazy Fisher-Yates: position -> id moved there
+        n = len(pool)
+        for i in range(n):
+            if len(picked) >= k:
+                break
+            j = rng.randrange(i, n)
+            exercise_id = swapped.get(j, pool[j])
+            swapped[j] = swapped.get(i, pool[i])
+            record = self.records[exercise_id]
+            if not matches(record):
+                continue
+            if exercise_id in exclude:
+                excluded.append(record)
+            else:
+                picked.append(record)
+        return picked + excluded[:k - len(picked)]
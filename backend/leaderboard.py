@@ -0,0 +1,124 @@
+"""In-memory leaderboard standings with O(log n) rank queries.
+
+Each period (daily, weekly, monthly, all-time) keeps the current
+window's XP per user in a SortedList ordered by XP descending, so rank,
+top-N and "around me" queries never sort. Standings are fed XP events
+as they land in the ledger (see ``xp_event`` in app.py); a window that
+ends is dropped and the next one starts empty.
+"""
+import threading
+from collections import namedtuple
+from datetime import date, timedelta
+
+from sortedcontainers import SortedList
+
+PERIODS = ('daily', 'weekly', 'monthly', 'all_time')
+
+ALL_TIME_START = date(1970, 1, 1)
+
+Standing = namedtuple('Standing', ['rank', 'user_id', 'xp'])
+
+
+def period_start(period, day):
+    """First day of the ``period`` window containing ``day``."""
+    if period == 'daily':
+        return day
+    if period == 'weekly':
+        return day - timedelta(days=day.weekday())
+    if period == 'monthly':
+        return day.replace(day=1)
+    if period == 'all_time':
+        return ALL_TIME_START
+    raise ValueError(f'Unknown leaderboard period: {period}')
+
+
+class Standings:
+    """XP per user plus an order-statistic index over it.
+
+    Ties are broken by user id so every user has a distinct rank.
+    """
+
+    def __init__(self, scores=None):
+        self._scores = dict(scores or {})
+        self._order = SortedList((-xp, user_id) for user_id, xp in self._scores.items())
+
+    def __len__(self):
+        return len(self._scores)
+
+    def xp(self, user_id):
+        return self._scores.get(user_id)
+
+    def add(self, user_id, amount):
+        self.set(user_id, self._scores.get(user_id, 0) + amount)
+
+    def set(self, user_id, xp):
+        old = self._scores.get(user_id)
+        if old is not None:
+            self._order.remove((-old, user_id))
+        self._scores[user_id] = xp
+        self._order.add((-xp, user_id))
+
+    def rank(self, user_id):
+        xp = self._scores.get(user_id)
+        if xp is None:
+            return None
+        return self._order.index((-xp, user_id)) + 1
+
+    def _slice(self, start, stop):
+        return [
+            Standing(rank, user_id, -neg_xp)
+            for rank, (neg_xp, user_id) in enumerate(self._order.islice(start, stop), start + 1)
+        ]
+
+    def top(self, n):
+        return self._slice(0, n)
+
+    def around(self, user_id, k):
+        """The user's standing with up to ``k`` neighbours on each side."""
+        rank = self.rank(user_id)
+        if rank is None:
+            return []
+        return self._slice(max(rank - 1 - k, 0), rank + k)
+
+
+class LeaderboardEngine:
+    """Current-window Standings for every period, fed by XP events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._windows = {}
+
+    def load(self, windows):
+        """Replace all standings; ``windows`` maps period -> (start, scores)."""
+        loaded = {period: (start, Standings(scores)) for period, (start, scores) in windows.items()}
+        with self._lock:
+            self._windows = loaded
+
+    def apply(self, user_id, amount, day):
+        """Add an XP event that happened on ``day`` to every period."""
+        with self._lock:
+            for period in PERIODS:
+                start = period_start(period, day)
+                current = self._windows.get(period)
+                if current is None or start > current[0]:
+                    current = self._windows[period] = (start, Standings())
+                elif start < current[0]:
+                    continue  # late event for a window that has closed
+                current[1].add(user_id, amount)
+
+    def _standings(self, period, today):
+        start = period_start(period, today)
+        current = self._windows.get(period)
+        if current is None or current[0] != start:
+            return start, Standings()
+        return current
+
+    def top(self, period, n, today):
+        with self._lock:
+            start, standings = self._standings(period, today)
+            return start, standings.top(n), len(standings)
+
+    def around(self, period, user_id, k, today):
+        with self._lock:
+            start, standings = self._standings(period, today)
+            return start, standings.around(user_id, k), len(standings)
@@ -0,0 +1,64 @@
+"""Level curve: total XP -> level, as a precomputed threshold table.
+
+``thresholds[i]`` is the total XP needed to reach level ``i + 1``, so a
+lookup is one bisect instead of walking the curve a level at a time. The
+default is the original ``100 * level ** 1.5`` curve: a learner at level
+L moves up once their total XP reaches ``int(100 * L ** 1.5)``.
+"""
+from bisect import bisect_right
+from collections import namedtuple
+
+LevelInfo = namedtuple('LevelInfo', [
+    'level', 'xp', 'level_start_xp', 'next_level_xp', 'xp_to_next_level', 'progress'
+])
+LevelInfo.__doc__ = """Where a total XP sits on the curve.
+
+``next_level_xp`` and ``xp_to_next_level`` are None at the max level;
+``progress`` is the fraction of the current level completed, 0.0-1.0.
+"""
+
+
+class LevelCurve:
+    def __init__(self, thresholds):
+        thresholds = tuple(int(t) for t in thresholds)
+        if not thresholds or thresholds[0] != 0:
+            raise ValueError('Level 1 must start at 0 XP')
+        if any(b <= a for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError('Level thresholds must be strictly increasing')
+        self.thresholds = thresholds
+
+    @classmethod
+    def from_formula(cls, xp_to_leave_level, max_level):
+        """Build from ``xp_to_leave_level(level)``, the total XP that ends ``level``."""
+        return cls([0] + [xp_to_leave_level(level) for level in range(1, max_level)])
+
+    @classmethod
+    def power(cls, base=100, exponent=1.5, max_level=1000):
+        return cls.from_formula(lambda level: int(base * level ** exponent), max_level)
+
+    @property
+    def max_level(self):
+        return len(self.thresholds)
+
+    def level_for(self, xp):
+        return max(bisect_right(self.thresholds, xp or 0), 1)
+
+    def xp_to_leave(self, level):
+        """Total XP at which ``level`` ends, or None at the max level."""
+        return self.thresholds[level] if level < self.max_level else None
+
+    def info(self, xp):
+        xp = xp or 0
+        level = self.level_for(xp)
+        start = self.thresholds[level - 1]
+        next_xp = self.xp_to_leave(level)
+        if next_xp is None:
+            return LevelInfo(level, xp, start, None, None, 1.0)
+        return LevelInfo(
+            level=level,
+            xp=xp,
+            level_start_xp=start,
+            next_level_xp=next_xp,
+            xp_to_next_level=next_xp - xp,
+            progress=(xp - start) / (next_xp - start)
+        )
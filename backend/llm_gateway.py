@@ -0,0 +1,407 @@
+"""Guard rails around the chat model client.
+
+``LLMGateway`` wraps anything with Gemini's ``generate_content`` call
+shape and adds the following:
+
+- a per-process concurrency limit with a bounded wait queue;
+- an overall deadline plus a per-attempt timeout (passed upstream as
+  ``request_options={'timeout': ...}``);
+- retries with full jitter for transient errors;
+- a circuit breaker that fails fast while upstream keeps failing;
+- queue depth and latency percentile metrics.
+
+A slow or broken upstream then costs callers a quick 503 instead of a
+worker thread each. ``StandInModel`` is a local stand-in with tunable
+latency and error rate, for exercising the gateway without the network.
+"""
+import random
+import threading
+import time
+from collections import deque
+
+# HTTP statuses google.api_core attaches (as ``.code``) to errors worth retrying
+TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+TIMEOUT_STATUSES = frozenset({408, 504})
+
+
+class GatewayError(Exception):
+    """The gateway refused or gave up on a call."""
+    status = 503
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class GatewayBusy(GatewayError):
+    """Every slot is taken and the wait queue is full or timed out."""
+
+
+class CircuitOpen(GatewayError):
+    """Upstream has been failing; calls are refused until it cools down."""
+
+
+class GatewayTimeout(GatewayError):
+    """The call ran out of time, including any retries."""
+    status = 504
+
+
+def is_timeout(exc):
+    return isinstance(exc, TimeoutError) or getattr(exc, 'code', None) in TIMEOUT_STATUSES
+
+
+def is_transient(exc):
+    # A GatewayError (e.g. a busy chat worker) is a local refusal, not an
+    # upstream failure: never retried, never counted by the breaker
+    if isinstance(exc, GatewayError):
+        return False
+    return (
+        isinstance(exc, (TimeoutError, ConnectionError))
+        or getattr(exc, 'code', None) in TRANSIENT_STATUSES
+    )
+
+
+def percentiles(samples, points=(50, 90, 99)):
+    """Nearest-rank percentiles of ``samples``, in milliseconds."""
+    if not samples:
+        return {f'p{p}': None for p in points}
+    ordered = sorted(samples)
+    return {
+        f'p{p}': round(ordered[min(len(ordered) - 1, max(0, -(-p * len(ordered) // 100) - 1))] * 1000, 1)
+        for p in points
+    }
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive failures, for ``reset_timeout`` seconds.
+
+    Once the timeout passes, one probe call is let through (half-open):
+    success closes the breaker, failure opens it again.
+    """
+
+    def __init__(self, threshold=5, reset_timeout=30, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probing = None
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened_at is None:
+            return 'closed'
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def _retry_after(self):
+        return max(1, int(self.reset_timeout - (self._clock() - self._opened_at)) + 1)
+
+    def check(self):
+        """Raise CircuitOpen if a call right now would be refused."""
+        with self._lock:
+            state = self._state()
+            if state == 'open' or (state == 'half_open' and self._probing):
+                raise CircuitOpen('Chat is temporarily unavailable', retry_after=self._retry_after())
+
+    def acquire(self):
+        """Admit a call, claiming the probe if the breaker is half-open.
+
+        Returns a probe token if this caller claimed the probe, else None;
+        only that token can ``release`` it.
+        """
+        with self._lock:
+            state = self._state()
+            if state == 'open' or (state == 'half_open' and self._probing):
+                raise CircuitOpen('Chat is temporarily unavailable', retry_after=self._retry_after())
+            if state == 'half_open':
+                self._probing = object()
+                return self._probing
+            return None
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.threshold:
+                self._opened_at = self._clock()
+            self._probing = None
+
+    def release(self, probe):
+        """Give back ``probe`` unused (the call failed for a non-upstream reason).
+
+        A stale token, or None, is ignored: a call that never claimed the
+        current probe must not free it for a second caller.
+        """
+        with self._lock:
+            if probe is not None and self._probing is probe:
+                self._probing = None
+
+
+class LLMGateway:
+    def __init__(self, model, max_concurrency=4, queue_size=16, queue_timeout=5.0,
+                 call_timeout=30.0, deadline=45.0, retries=2, backoff=0.5, max_backoff=4.0,
+                 breaker=None, sample_size=1000, rng=None):
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.call_timeout = call_timeout
+        self.deadline = deadline
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = breaker or CircuitBreaker()
+        self._rng = rng or random.Random()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._latency = deque(maxlen=sample_size)
+        self._queue_wait = deque(maxlen=sample_size)
+        self._metrics = {
+            'calls': 0, 'succeeded': 0, 'failed': 0, 'retries': 0, 'timeouts': 0,
+            'rejected_busy': 0, 'rejected_open': 0, 'max_queued': 0
+        }
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._metrics[name] += amount
+
+    def _acquire_slot(self):
+        with self._lock:
+            if self._queued >= self.queue_size:
+                self._metrics['rejected_busy'] += 1
+                raise GatewayBusy('Chat is busy, please try again shortly', retry_after=1)
+            self._queued += 1
+            self._metrics['max_queued'] = max(self._metrics['max_queued'], self._queued)
+        started = time.monotonic()
+        acquired = self._slots.acquire(timeout=self.queue_timeout)
+        with self._lock:
+            self._queued -= 1
+            if acquired:
+                self._in_flight += 1
+                self._queue_wait.append(time.monotonic() - started)
+            else:
+                self._metrics['rejected_busy'] += 1
+        if not acquired:
+            raise GatewayBusy('Chat is busy, please try again shortly', retry_after=1)
+
+    def _release_slot(self):
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def _attempts(self, started, call, probes):
+        """Run ``call(timeout)`` with retries until it succeeds or time runs out.
+
+        Probes claimed before a retry are appended to ``probes``.
+        """
+        attempt = 0
+        while True:
+            remaining = self.deadline - (time.monotonic() - started)
+            if remaining <= 0:
+                self._count('timeouts')
+                raise GatewayTimeout('Chat took too long to respond')
+            try:
+                return call(min(self.call_timeout, remaining))
+            except Exception as exc:
+                if not is_transient(exc):
+                    raise
+                self.breaker.record_failure()
+                if is_timeout(exc):
+                    self._count('timeouts')
+                delay = self._rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+                if attempt >= self.retries or time.monotonic() - started + delay >= self.deadline:
+                    if is_timeout(exc):
+                        raise GatewayTimeout('Chat took too long to respond') from exc
+                    raise
+                # A failure may have opened the breaker; don't retry into it
+                probes.append(self.breaker.acquire())
+                attempt += 1
+                self._count('retries')
+                time.sleep(delay)
+
+    def _admit(self):
+        """Claim the breaker and a slot; returns the breaker's probe token."""
+        try:
+            probe = self.breaker.acquire()
+        except CircuitOpen:
+            self._count('rejected_open')
+            raise
+        try:
+            self._acquire_slot()
+        except GatewayBusy:
+            self.breaker.release(probe)
+            raise
+        self._count('calls')
+        return probe
+
+    def _release(self, probes):
+        for probe in probes:
+            self.breaker.release(probe)
+
+    def _finish(self, started, ok):
+        with self._lock:
+            if ok:
+                self._metrics['succeeded'] += 1
+                self._latency.append(time.monotonic() - started)
+            else:
+                self._metrics['failed'] += 1
+
+    def check(self):
+        """Fail fast with CircuitOpen before committing to a response."""
+        self.breaker.check()
+
+    def generate(self, prompt):
+        """The model's reply text for ``prompt``, or '' if it had none."""
+        probes = [self._admit()]
+        started = time.monotonic()
+        ok = False
+        try:
+            response = self._attempts(started, lambda timeout: self.model.generate_content(
+                prompt, request_options={'timeout': timeout}
+            ), probes)
+            self.breaker.record_success()
+            ok = True
+            return response.text if response else ''
+        finally:
+            self._release(probes)
+            self._finish(started, ok)
+            self._release_slot()
+
+    def stream(self, prompt, cancel=None):
+        """Yield reply text chunks for ``prompt``; the slot is held until done.
+
+        Transient errors are retried only until the first chunk arrives;
+        after that a failure ends the stream. If the caller closes the
+        generator early, ``cancel(upstream)`` is called on the model stream.
+        """
+        probes = [self._admit()]
+        started = time.monotonic()
+        ok = False
+        upstream = None
+        finished = False
+
+        def first_chunk(timeout):
+            nonlocal upstream
+            upstream = self.model.generate_content(prompt, stream=True, request_options={'timeout': timeout})
+            chunks = iter(upstream)
+            return chunks, next(chunks, None)
+
+        chunks, chunk = None, None
+        try:
+            chunks, chunk = self._attempts(started, first_chunk, probes)
+            while chunk is not None:
+                text = getattr(chunk, 'text', '')
+                if text:
+                    yield text
+                chunk = next(chunks, None)
+            finished = True
+            self.breaker.record_success()
+            ok = True
+        except Exception as exc:
+            finished = True
+            # Failures before the first chunk were recorded by _attempts
+            if chunks is not None and is_transient(exc):
+                self.breaker.record_failure()
+            raise
+        finally:
+            if upstream is not None and not finished and cancel is not None:
+                cancel(upstream)
+            self._release(probes)
+            self._finish(started, ok)
+            self._release_slot()
+
+    def stats(self):
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['queued'] = self._queued
+            metrics['in_flight'] = self._in_flight
+            latency = list(self._latency)
+            queue_wait = list(self._queue_wait)
+        metrics['max_concurrency'] = self.max_concurrency
+        metrics['queue_size'] = self.queue_size
+        metrics['breaker'] = self.breaker.state
+        metrics['latency_ms'] = percentiles(latency)
+        metrics['queue_wait_ms'] = percentiles(queue_wait)
+        return metrics
+
+
+class StandInError(Exception):
+    def __init__(self, code):
+        super().__init__(f'Stand-in model error {code}')
+        self.code = code
+
+
+class StandInChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class StandInStream:
+    def __init__(self, chunks, delay):
+        self._chunks = chunks
+        self._delay = delay
+        self.cancelled = False
+
+    def __iter__(self):
+        for text in self._chunks:
+            if self.cancelled:
+                return
+            time.sleep(self._delay)
+            yield StandInChunk(text)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class StandInModel:
+    """Local replacement for ``genai.GenerativeModel`` with injected faults.
+
+    Each call waits ``latency`` seconds (plus up to ``jitter``), giving up
+    with TimeoutError once the request timeout passes, and fails with
+    ``StandInError(error_status)`` at ``error_rate``. Replies echo the
+    end of the prompt.
+    """
+
+    def __init__(self, latency=0.5, jitter=0.0, error_rate=0.0, error_status=503, chunks=5, rng=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.chunks = chunks
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+
+    def _roll(self):
+        with self._lock:
+            return self.latency + self._rng.uniform(0, self.jitter), self._rng.random() < self.error_rate
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        latency, fail = self._roll()
+        timeout = (request_options or {}).get('timeout')
+        first_wait = latency / self.chunks if stream else latency
+        if timeout is not None and first_wait > timeout:
+            time.sleep(timeout)
+            raise TimeoutError('Stand-in model timed out')
+        if fail:
+            time.sleep(first_wait)
+            raise StandInError(self.error_status)
+        text = f'Stand-in reply to: {prompt[-80:]}'
+        if not stream:
+            time.sleep(latency)
+            return StandInChunk(text)
+        size = max(1, -(-len(text) // self.chunks))
+        return StandInStream([text[i:i + size] for i in range(0, len(text), size)], latency / self.chunks)
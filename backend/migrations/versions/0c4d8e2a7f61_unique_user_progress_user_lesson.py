@@ -0,0 +1,44 @@
+"""Make user_progress unique per user and lesson
+
+Revision ID: 0c4d8e2a7f61
+Revises: f3a7c1e95b20
+Create Date: 2026-10-18 14:48:30.902271
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0c4d8e2a7f61'
+down_revision = 'f3a7c1e95b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep one row per (user, lesson): a completed one if any, else the oldest
+    op.execute("""
+        DELETE FROM user_progress a
+        USING user_progress b
+        WHERE a.user_id = b.user_id
+          AND a.lesson_id = b.lesson_id
+          AND (COALESCE(b.completed, false), -b.id) > (COALESCE(a.completed, false), -a.id)
+    """)
+    # Repeat completions inflated the per-user lesson counter
+    op.execute("""
+        UPDATE "user" u
+        SET total_lessons_completed = (
+            SELECT COUNT(*) FROM user_progress p
+            WHERE p.user_id = u.id AND p.completed AND p.lesson_id IS NOT NULL
+        )
+    """)
+    with op.batch_alter_table('user_progress', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_progress_user_lesson')
+        batch_op.create_index('ix_user_progress_user_lesson', ['user_id', 'lesson_id'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('user_progress', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_progress_user_lesson')
+        batch_op.create_index('ix_user_progress_user_lesson', ['user_id', 'lesson_id'], unique=False)
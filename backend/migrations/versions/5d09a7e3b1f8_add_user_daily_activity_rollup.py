@@ -0,0 +1,34 @@
+"""Add user_daily_activity rollup
+
+Revision ID: 5d09a7e3b1f8
+Revises: e4b81d6c2a57
+Create Date: 2026-10-18 12:41:55.206317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d09a7e3b1f8'
+down_revision = 'e4b81d6c2a57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_daily_activity',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('activity_date', sa.Date(), nullable=False),
+    sa.Column('xp_earned', sa.Integer(), nullable=False),
+    sa.Column('lessons_completed', sa.Integer(), nullable=False),
+    sa.Column('exercises_solved', sa.Integer(), nullable=False),
+    sa.Column('time_spent_seconds', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'activity_date')
+    )
+    # Populate with `flask backfill-daily-activity`
+
+
+def downgrade():
+    op.drop_table('user_daily_activity')
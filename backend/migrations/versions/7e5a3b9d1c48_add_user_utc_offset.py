@@ -0,0 +1,28 @@
+"""Add user utc_offset_minutes for streak rollover
+
+Revision ID: 7e5a3b9d1c48
+Revises: 0c4d8e2a7f61
+Create Date: 2026-10-18 15:31:09.660143
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e5a3b9d1c48'
+down_revision = '0c4d8e2a7f61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('utc_offset_minutes', sa.Integer(), server_default='0', nullable=False))
+        batch_op.create_index('ix_user_utc_offset_id', ['utc_offset_minutes', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_utc_offset_id')
+        batch_op.drop_column('utc_offset_minutes')
@@ -0,0 +1,34 @@
+"""Make user_achievement unique per user and achievement
+
+Revision ID: 8b2e6f0d4c19
+Revises: 5d09a7e3b1f8
+Create Date: 2026-10-18 13:22:47.518094
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e6f0d4c19'
+down_revision = '5d09a7e3b1f8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the earliest award where a badge was granted twice
+    op.execute("""
+        DELETE FROM user_achievement a
+        USING user_achievement b
+        WHERE a.user_id = b.user_id
+          AND a.achievement_id = b.achievement_id
+          AND a.id > b.id
+    """)
+    with op.batch_alter_table('user_achievement', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_user_achievement_user_achievement', ['user_id', 'achievement_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('user_achievement', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_user_achievement_user_achievement', type_='unique')
@@ -0,0 +1,26 @@
+"""Index user_progress by user and lesson
+
+Revision ID: a3f1c9d27e41
+Revises: 56ca3d4c6d2d
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f1c9d27e41'
+down_revision = '56ca3d4c6d2d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user_progress', schema=None) as batch_op:
+        batch_op.create_index('ix_user_progress_user_lesson', ['user_id', 'lesson_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user_progress', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_progress_user_lesson')
@@ -0,0 +1,38 @@
+"""Add chat_cache_entry for the tutor chat response cache
+
+Revision ID: b6d2f4a8e913
+Revises: 7e5a3b9d1c48
+Create Date: 2026-10-18 16:42:27.318506
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6d2f4a8e913'
+down_revision = '7e5a3b9d1c48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('chat_cache_entry',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('namespace', sa.String(length=16), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('reply', sa.Text(), nullable=False),
+    sa.Column('generation_ms', sa.Integer(), nullable=False),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    with op.batch_alter_table('chat_cache_entry', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_chat_cache_entry_namespace'), ['namespace'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('chat_cache_entry', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_chat_cache_entry_namespace'))
+
+    op.drop_table('chat_cache_entry')
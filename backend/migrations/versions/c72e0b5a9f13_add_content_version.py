@@ -0,0 +1,29 @@
+"""Add content_version counter for catalog ETags
+
+Revision ID: c72e0b5a9f13
+Revises: a3f1c9d27e41
+Create Date: 2026-10-18 10:03:17.402551
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c72e0b5a9f13'
+down_revision = 'a3f1c9d27e41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    content_version = op.create_table('content_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(content_version, [{'id': 1, 'version': 1}])
+
+
+def downgrade():
+    op.drop_table('content_version')
@@ -0,0 +1,48 @@
+"""Add quiz_stats counters and quiz_attempt indexes
+
+Revision ID: e4b81d6c2a57
+Revises: c72e0b5a9f13
+Create Date: 2026-10-18 11:26:04.731982
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b81d6c2a57'
+down_revision = 'c72e0b5a9f13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('quiz_stats',
+    sa.Column('quiz_id', sa.Integer(), nullable=False),
+    sa.Column('participants', sa.Integer(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('passes', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['quiz_id'], ['quiz.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('quiz_id')
+    )
+    with op.batch_alter_table('quiz_attempt', schema=None) as batch_op:
+        batch_op.create_index('ix_quiz_attempt_user_quiz', ['user_id', 'quiz_id'], unique=False)
+        batch_op.create_index('ix_quiz_attempt_quiz_id', ['quiz_id'], unique=False)
+
+    # Seed the counters from existing attempts
+    op.execute("""
+        INSERT INTO quiz_stats (quiz_id, participants, attempts, passes, updated_at)
+        SELECT quiz_id, COUNT(DISTINCT user_id), COUNT(id),
+               SUM(CASE WHEN is_passed THEN 1 ELSE 0 END), now()
+        FROM quiz_attempt
+        GROUP BY quiz_id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('quiz_attempt', schema=None) as batch_op:
+        batch_op.drop_index('ix_quiz_attempt_quiz_id')
+        batch_op.drop_index('ix_quiz_attempt_user_quiz')
+
+    op.drop_table('quiz_stats')
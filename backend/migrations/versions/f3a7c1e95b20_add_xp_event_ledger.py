@@ -0,0 +1,66 @@
+"""Add xp_event ledger and unique leaderboard periods
+
+Revision ID: f3a7c1e95b20
+Revises: 8b2e6f0d4c19
+Create Date: 2026-10-18 14:05:12.384610
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a7c1e95b20'
+down_revision = '8b2e6f0d4c19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('xp_event',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('source_type', sa.String(length=20), nullable=False),
+    sa.Column('source_id', sa.Integer(), nullable=True),
+    sa.Column('amount', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('aggregated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('xp_event', schema=None) as batch_op:
+        batch_op.create_index('ix_xp_event_user_created', ['user_id', 'created_at'], unique=False)
+        batch_op.create_index('ix_xp_event_pending', ['id'], unique=False,
+                              postgresql_where=sa.text('aggregated_at IS NULL'))
+
+    # Opening balances, so replaying the ledger reproduces today's totals.
+    # Marked aggregated: they predate the ledger and belong to no period.
+    op.execute("""
+        INSERT INTO xp_event (user_id, source_type, source_id, amount, created_at, aggregated_at)
+        SELECT id, 'opening_balance', NULL, total_xp,
+               now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+        FROM "user"
+        WHERE COALESCE(total_xp, 0) <> 0
+    """)
+
+    op.execute("""
+        DELETE FROM leaderboard a
+        USING leaderboard b
+        WHERE a.user_id = b.user_id
+          AND a.period = b.period
+          AND a.period_start = b.period_start
+          AND a.id > b.id
+    """)
+    with op.batch_alter_table('leaderboard', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_leaderboard_user_period', ['user_id', 'period', 'period_start'])
+
+
+def downgrade():
+    with op.batch_alter_table('leaderboard', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_leaderboard_user_period', type_='unique')
+
+    with op.batch_alter_table('xp_event', schema=None) as batch_op:
+        batch_op.drop_index('ix_xp_event_pending', postgresql_where=sa.text('aggregated_at IS NULL'))
+        batch_op.drop_index('ix_xp_event_user_created')
+
+    op.drop_table('xp_event')
@@ -0,0 +1,73 @@
+"""Answer normalization and answer-sheet grading for quizzes.
+
+Answer keys are normalized once when the content snapshot is built, so
+grading a submission is one normalization and one comparison per
+submitted answer.
+"""
+import re
+from collections import namedtuple
+from decimal import Decimal, InvalidOperation
+
+AnswerKey = namedtuple('AnswerKey', ['answer', 'points', 'correct_answer', 'explanation'])
+
+_WHITESPACE = re.compile(r'\s+')
+_NUMBER = re.compile(r'^[+-]?(\d{1,3}(,\d{3})+|\d+)(\.\d+)?$')
+
+
+def normalize_answer(value):
+    """Canonical form for comparing answers.
+
+    Case and surrounding/repeated whitespace are ignored, and numbers are
+    compared by value, so "1,000", "1000" and "1000.0" are the same answer.
+    """
+    if value is None:
+        return ''
+    text = _WHITESPACE.sub(' ', str(value)).strip().lower()
+    if _NUMBER.match(text):
+        try:
+            number = Decimal(text.replace(',', ''))
+        except InvalidOperation:
+            return text
+        text = format(number.normalize(), 'f')
+        if text == '-0':
+            text = '0'
+    return text
+
+
+def build_answer_key(question):
+    return AnswerKey(
+        answer=normalize_answer(question.correct_answer),
+        points=question.points or 0,
+        correct_answer=question.correct_answer,
+        explanation=question.explanation
+    )
+
+
+def grade_answer_sheet(answer_key, answers):
+    """Grade ``answers`` (question id -> answer) against ``answer_key``.
+
+    Question ids may be given as ints or strings, as they arrive from
+    JSON. Unanswered questions count as wrong. Returns
+    ``(earned_points, total_points, correct_count, results)`` where
+    ``results`` maps question id -> bool.
+    """
+    submitted = {}
+    for question_id, answer in answers.items():
+        try:
+            submitted[int(question_id)] = answer
+        except (TypeError, ValueError):
+            continue
+
+    earned = total = correct_count = 0
+    results = {}
+    for question_id, key in answer_key.items():
+        total += key.points
+        is_correct = (
+            question_id in submitted
+            and normalize_answer(submitted[question_id]) == key.answer
+        )
+        if is_correct:
+            earned += key.points
+            correct_count += 1
+        results[question_id] = is_correct
+    return earned, total, correct_count, results
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+import pytest
+
+from achievement_rules import compile_achievement_rules, parse_criteria
+
+
+@pytest.mark.parametrize('criteria, expected', [
+    ('lessons_completed >= 10', ('lessons_completed', 10)),
+    ('streak:7', ('streak', 7)),
+    ('first_lesson', ('lessons_completed', 1)),
+    # The format init_sample_data seeds
+    ("{'lessons_completed': 1}", ('lessons_completed', 1)),
+    ("{'daily_streak': 7}", ('streak', 7)),
+    ('{"total_xp": 500}', ('xp', 500)),
+])
+def test_parse_supported_criteria(criteria, expected):
+    assert parse_criteria(criteria) == expected
+
+
+@pytest.mark.parametrize('criteria', [
+    None, '', "{'perfect_quiz': 1}", "{'quick_solve': 30}",
+    "{'lessons_completed': 1, 'daily_streak': 7}", "{'lessons_completed': '1'}",
+    "{'lessons_completed': True}", "{'lessons_completed': -1}", '{not python}', 'unknown >= 3',
+])
+def test_parse_unsupported_criteria(criteria):
+    assert parse_criteria(criteria) is None
+
+
+def test_seeded_achievements_compile():
+    seeded = [
+        (1, {'lessons_completed': 1}), (2, {'lessons_completed': 5}),
+        (5, {'daily_streak': 7}), (7, {'perfect_quiz': 1}),
+    ]
+    achievements = [SimpleNamespace(id=i, criteria=str(c), xp_reward=25) for i, c in seeded]
+    rules = compile_achievement_rules(achievements)
+
+    assert rules.unsupported == (7,)
+    assert rules.counters() == {'lessons_completed', 'streak'}
+    assert [r.achievement_id for r in rules.evaluate({'lessons_completed': 5, 'streak': 3})] == [1, 2]
+    assert [r.achievement_id for r in rules.evaluate({'streak': 7}, earned_ids={1, 2})] == [5]
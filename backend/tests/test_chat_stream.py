@@ -0,0 +1,109 @@
+import json
+
+from chat_sse import relay_chat_stream, sse_event
+from chat_worker import cancel_stream
+from llm_gateway import LLMGateway
+
+
+class FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeStream:
+    """Canned chunks, optionally failing after ``fail_after`` of them."""
+
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.sent = 0
+        self.cancelled = False
+
+    def __iter__(self):
+        for text in self.chunks:
+            if self.cancelled:
+                return
+            if self.fail_after is not None and self.sent >= self.fail_after:
+                raise RuntimeError('upstream broke')
+            self.sent += 1
+            yield FakeChunk(text)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeStreamingModel:
+    def __init__(self, chunks, fail_after=None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.streams = []
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        assert stream
+        self.streams.append(FakeStream(self.chunks, self.fail_after))
+        return self.streams[-1]
+
+
+def relay(model, completed):
+    gateway = LLMGateway(model, retries=0)
+    return gateway, relay_chat_stream(
+        lambda: gateway.stream('prompt', cancel=cancel_stream),
+        done=lambda: {'source': 'model'},
+        on_complete=completed.append
+    )
+
+
+def parse(frame):
+    event, data = None, None
+    for line in frame.strip().split('\n'):
+        if line.startswith('event: '):
+            event = line[len('event: '):]
+        elif line.startswith('data: '):
+            data = json.loads(line[len('data: '):])
+    return event, data
+
+
+def test_sse_event_format():
+    assert sse_event({'a': 1}) == 'data: {"a": 1}\n\n'
+    assert sse_event({'a': 1}, event='done') == 'event: done\ndata: {"a": 1}\n\n'
+
+
+def test_frames_in_order_then_done():
+    completed = []
+    _, frames = relay(FakeStreamingModel(['Hel', 'lo', '!']), completed)
+    frames = list(frames)
+
+    assert frames[0].startswith(':')
+    assert [parse(f) for f in frames[1:]] == [
+        (None, {'text': 'Hel'}), (None, {'text': 'lo'}), (None, {'text': '!'}),
+        ('done', {'source': 'model', 'done': True}),
+    ]
+    assert completed == ['Hello!']
+
+
+def test_mid_stream_failure_sends_error_event():
+    completed = []
+    _, frames = relay(FakeStreamingModel(['a', 'b', 'c'], fail_after=2), completed)
+    events = [parse(f) for f in list(frames)[1:]]
+
+    assert events[:2] == [(None, {'text': 'a'}), (None, {'text': 'b'})]
+    assert events[2][0] == 'error'
+    assert 'upstream broke' in events[2][1]['error']
+    assert len(events) == 3
+    assert completed == []
+
+
+def test_client_disconnect_cancels_upstream():
+    model = FakeStreamingModel(['a', 'b', 'c', 'd'])
+    completed = []
+    gateway, frames = relay(model, completed)
+
+    next(frames)  # connected comment
+    assert parse(next(frames)) == (None, {'text': 'a'})
+    frames.close()
+
+    upstream = model.streams[0]
+    assert upstream.cancelled
+    assert upstream.sent == 1
+    assert completed == []
+    assert gateway.stats()['in_flight'] == 0
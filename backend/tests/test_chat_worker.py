@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+
+from chat_worker import ChatWorkerClient, ChatWorkerError, make_server
+from llm_gateway import CircuitBreaker, GatewayBusy, LLMGateway, StandInModel
+
+
+class Reply:
+    def __init__(self, text):
+        self.text = text
+
+
+class BlockingModel:
+    """Holds every call until ``release`` is set; records request timeouts."""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.timeouts = []
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        self.timeouts.append((request_options or {}).get('timeout'))
+        self.entered.set()
+        self.release.wait(5)
+        return Reply(f'reply to {prompt}')
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(model, **kwargs):
+        server = make_server('127.0.0.1:0', model, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        host, port = server.server_address
+        return ChatWorkerClient(f'{host}:{port}')
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_generate_and_stream(serve):
+    client = serve(StandInModel(latency=0.01))
+
+    assert client.generate_content('hello').text == 'Stand-in reply to: hello'
+    chunks = [c.text for c in client.generate_content('hello', stream=True)]
+    assert ''.join(chunks) == 'Stand-in reply to: hello'
+
+
+def test_upstream_error_keeps_status(serve):
+    client = serve(StandInModel(latency=0, error_rate=1.0, error_status=503))
+
+    with pytest.raises(ChatWorkerError) as info:
+        client.generate_content('hello')
+    assert info.value.code == 503
+
+
+def test_busy_worker_is_not_an_upstream_failure(serve):
+    model = BlockingModel()
+    client = serve(model, workers=1, slot_timeout=0.05)
+    breaker = CircuitBreaker(threshold=1)
+    gateway = LLMGateway(client, retries=2, backoff=0, breaker=breaker)
+
+    holder = threading.Thread(target=gateway.generate, args=('first',))
+    holder.start()
+    try:
+        assert model.entered.wait(5)
+        with pytest.raises(GatewayBusy):
+            gateway.generate('second')
+    finally:
+        model.release.set()
+        holder.join()
+
+    stats = gateway.stats()
+    assert stats['retries'] == 0
+    assert breaker.state == 'closed'
+    assert len(model.timeouts) == 1
+
+
+def test_slot_wait_comes_out_of_the_model_timeout(serve):
+    model = BlockingModel()
+    client = serve(model, workers=1, slot_timeout=1.0)
+    options = {'request_options': {'timeout': 5}}
+
+    holder = threading.Thread(target=client.generate_content, args=('first',), kwargs=options)
+    holder.start()
+    assert model.entered.wait(5)
+    # The second request waits ~0.2s for the slot before reaching the model
+    threading.Timer(0.2, model.release.set).start()
+    assert client.generate_content('second', **options).text == 'reply to second'
+    holder.join()
+
+    assert model.timeouts[0] == pytest.approx(5, abs=0.05)
+    assert model.timeouts[1] <= 4.85
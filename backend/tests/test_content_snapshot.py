@@ -0,0 +1,57 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from content_snapshot import build_content_snapshot
+from quiz_grading import normalize_answer
+
+BEGINNER = SimpleNamespace(value='beginner')
+
+
+def make_exercise(exercise_id, lesson_id):
+    # Shaped like the Exercise model: no ``points`` column
+    exercise = SimpleNamespace(
+        id=exercise_id, lesson_id=lesson_id, question=f'What is {exercise_id} x 98?',
+        correct_answer=str(exercise_id * 98), explanation='Nikhilam.', difficulty=BEGINNER,
+        xp_reward=10, question_type='calculation', options=None, hints=None,
+        step_by_step_solution=None, time_limit=60, tags='Multiplication, Nikhilam',
+        created_at=datetime(2025, 7, 1)
+    )
+    exercise.to_dict = lambda: {'id': exercise.id, 'question': exercise.question}
+    return exercise
+
+
+def make_lesson(lesson_id, unit_id, exercises):
+    lesson = SimpleNamespace(
+        id=lesson_id, unit_id=unit_id, title=f'Lesson {lesson_id}', description='',
+        content_json={}, difficulty='beginner', order_index=lesson_id, xp_reward=50,
+        estimated_time=15, is_published=True, exercises=exercises
+    )
+    lesson.to_dict = lambda: {'id': lesson.id, 'title': lesson.title}
+    return lesson
+
+
+def make_unit(unit_id):
+    return SimpleNamespace(
+        id=unit_id, title='Unit', description='', difficulty=BEGINNER,
+        color_theme='blue', order_index=unit_id, estimated_duration=60
+    )
+
+
+def test_snapshot_builds_with_exercises():
+    exercises = [make_exercise(1, 1), make_exercise(2, 1)]
+    snapshot = build_content_snapshot(1, [make_unit(1)], [make_lesson(1, 1, exercises)], quizzes=[])
+
+    assert len(snapshot.drill) == 2
+    key = snapshot.drill.answer_keys[1]
+    assert key.answer == normalize_answer('98')
+    assert key.points == 10
+    assert 'correct_answer' not in snapshot.drill.records[1].payload
+
+
+def test_snapshot_drill_exercises_override():
+    lesson = make_lesson(1, 1, [make_exercise(1, 1)])
+    snapshot = build_content_snapshot(
+        1, [make_unit(1)], [lesson], quizzes=[], drill_exercises=[make_exercise(7, None)]
+    )
+
+    assert list(snapshot.drill.records) == [7]
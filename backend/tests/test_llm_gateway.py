@@ -0,0 +1,256 @@
+import threading
+
+import pytest
+
+from llm_gateway import (
+    CircuitBreaker, CircuitOpen, GatewayBusy, GatewayTimeout, LLMGateway, StandInModel, percentiles
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class UpstreamError(Exception):
+    def __init__(self, code):
+        super().__init__(f'upstream {code}')
+        self.code = code
+
+
+class FakeReply:
+    def __init__(self, text):
+        self.text = text
+
+
+class ScriptedModel:
+    """Raises or answers per call, following ``outcomes`` (exceptions or text)."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.timeouts = []
+
+    def generate_content(self, prompt, stream=False, request_options=None):
+        self.calls += 1
+        self.timeouts.append((request_options or {}).get('timeout'))
+        outcome = self.outcomes.pop(0) if self.outcomes else 'ok'
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return FakeReply(outcome)
+
+
+def gateway(model, **kwargs):
+    kwargs.setdefault('backoff', 0)
+    return LLMGateway(model, **kwargs)
+
+
+def test_breaker_opens_then_half_opens_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=2, reset_timeout=10, clock=clock)
+    model = ScriptedModel(UpstreamError(503), UpstreamError(503))
+    gw = gateway(model, retries=0, breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(UpstreamError):
+            gw.generate('x')
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpen):
+        gw.generate('x')
+    assert model.calls == 2
+    assert gw.stats()['rejected_open'] == 1
+
+    clock.now = 10
+    assert breaker.state == 'half_open'
+    assert gw.generate('x') == 'ok'
+    assert breaker.state == 'closed'
+
+
+def test_failed_probe_reopens_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    gw = gateway(ScriptedModel(UpstreamError(500), UpstreamError(500)), retries=0, breaker=breaker)
+
+    with pytest.raises(UpstreamError):
+        gw.generate('x')
+    clock.now = 10
+    with pytest.raises(UpstreamError):
+        gw.generate('x')
+    assert breaker.state == 'open'
+
+
+def test_half_open_admits_one_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+
+    assert breaker.acquire() is not None
+    with pytest.raises(CircuitOpen):
+        breaker.acquire()
+
+
+def test_only_the_probe_owner_releases_it():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    bystander = breaker.acquire()
+    assert bystander is None
+    breaker.record_failure()
+    clock.now = 10
+    stale = breaker.acquire()
+    breaker.record_failure()
+    clock.now = 20
+    probe = breaker.acquire()
+
+    # Neither a call admitted while closed nor an earlier probe frees it
+    breaker.release(bystander)
+    breaker.release(stale)
+    with pytest.raises(CircuitOpen):
+        breaker.acquire()
+
+    breaker.release(probe)
+    assert breaker.acquire() is not None
+
+
+def test_call_finishing_during_probe_keeps_probe_claimed():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    entered = {'early': threading.Event(), 'probe': threading.Event()}
+    release = {'early': threading.Event(), 'probe': threading.Event()}
+    errors = []
+
+    class InterleavedModel:
+        def generate_content(self, prompt, stream=False, request_options=None):
+            if prompt not in entered:
+                raise UpstreamError(503)
+            entered[prompt].set()
+            release[prompt].wait(5)
+            if prompt == 'early':
+                # A local error: neither a success nor an upstream failure
+                raise ValueError('bad prompt')
+            return FakeReply('ok')
+
+    gw = gateway(InterleavedModel(), retries=0, max_concurrency=3, breaker=breaker)
+
+    def call(prompt):
+        try:
+            gw.generate(prompt)
+        except Exception as e:
+            errors.append(e)
+
+    early = threading.Thread(target=call, args=('early',))
+    probe = threading.Thread(target=call, args=('probe',))
+    early.start()
+    try:
+        assert entered['early'].wait(5)
+        with pytest.raises(UpstreamError):
+            gw.generate('fail')
+        clock.now = 10
+        probe.start()
+        assert entered['probe'].wait(5)
+
+        # The early call ends while the probe is in flight...
+        release['early'].set()
+        early.join(5)
+        # ...and must not hand the probe to a second caller
+        with pytest.raises(CircuitOpen):
+            gw.generate('second probe')
+    finally:
+        release['early'].set()
+        release['probe'].set()
+        early.join(5)
+        if probe.ident:
+            probe.join(5)
+
+    assert [type(e) for e in errors] == [ValueError]
+    assert breaker.state == 'closed'
+
+
+def test_timeout_counts_as_failure():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=60)
+    model = StandInModel(latency=0.2)
+    gw = gateway(model, call_timeout=0.01, deadline=0.05, retries=0, breaker=breaker)
+
+    with pytest.raises(GatewayTimeout):
+        gw.generate('x')
+    stats = gw.stats()
+    assert stats['timeouts'] == 1
+    assert stats['failed'] == 1
+    assert breaker.state == 'open'
+
+
+def test_per_attempt_timeout_is_passed_upstream():
+    model = ScriptedModel()
+    gateway(model, call_timeout=3, deadline=10).generate('x')
+    assert model.timeouts == [3]
+
+
+def test_saturation_rejects_instead_of_queueing():
+    release = threading.Event()
+    entered = threading.Event()
+
+    class BlockingModel:
+        def generate_content(self, prompt, stream=False, request_options=None):
+            entered.set()
+            release.wait(5)
+            return FakeReply('done')
+
+    gw = gateway(BlockingModel(), max_concurrency=1, queue_size=1, queue_timeout=0.05)
+    holder = threading.Thread(target=gw.generate, args=('first',))
+    holder.start()
+    try:
+        assert entered.wait(5)
+        # One slot busy; a waiter times out of the queue...
+        with pytest.raises(GatewayBusy):
+            gw.generate('second')
+        # ...and with the queue full, callers are turned away at once
+        gw.queue_size = 0
+        with pytest.raises(GatewayBusy):
+            gw.generate('third')
+    finally:
+        release.set()
+        holder.join()
+
+    stats = gw.stats()
+    assert stats['rejected_busy'] == 2
+    assert stats['in_flight'] == 0
+    assert stats['breaker'] == 'closed'
+
+
+def test_retries_transient_errors():
+    model = ScriptedModel(UpstreamError(503), ConnectionError('reset'), 'third time')
+    gw = gateway(model, retries=2)
+
+    assert gw.generate('x') == 'third time'
+    assert model.calls == 3
+    assert gw.stats()['retries'] == 2
+
+
+def test_does_not_retry_other_errors():
+    model = ScriptedModel(UpstreamError(400))
+    breaker = CircuitBreaker(threshold=1)
+    gw = gateway(model, retries=2, breaker=breaker)
+
+    with pytest.raises(UpstreamError):
+        gw.generate('x')
+    assert model.calls == 1
+    assert gw.stats()['retries'] == 0
+    assert breaker.state == 'closed'
+
+
+def test_gives_up_after_retries():
+    model = ScriptedModel(*[UpstreamError(503)] * 5)
+    gw = gateway(model, retries=2, breaker=CircuitBreaker(threshold=10))
+
+    with pytest.raises(UpstreamError):
+        gw.generate('x')
+    assert model.calls == 3
+
+
+def test_percentiles():
+    assert percentiles([]) == {'p50': None, 'p90': None, 'p99': None}
+    samples = [i / 1000 for i in range(1, 101)]
+    assert percentiles(samples) == {'p50': 50.0, 'p90': 90.0, 'p99': 99.0}
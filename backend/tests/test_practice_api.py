@@ -0,0 +1,80 @@
+import pytest
+
+import vedic_generator
+
+# app.py creates its tables on import, so these need the app's packages
+# and a reachable DATABASE_URL
+pytest.importorskip('flask_sqlalchemy')
+sqlalchemy_exc = pytest.importorskip('sqlalchemy.exc')
+jwt = pytest.importorskip('jwt')
+
+
+@pytest.fixture(scope='module')
+def backend():
+    try:
+        import app
+    except sqlalchemy_exc.OperationalError as e:
+        pytest.skip(f'database unavailable: {e}')
+    return app
+
+
+@pytest.fixture
+def client(backend, monkeypatch):
+    # The practice endpoints only need an authenticated caller
+    monkeypatch.setattr(backend, 'load_auth_claims', lambda user_id: (True, backend.UserRole.LEARNER))
+    token = jwt.encode({'user_id': 1}, backend.app.config['SECRET_KEY'], algorithm='HS256')
+    client = backend.app.test_client()
+    client.environ_base['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+    return client
+
+
+def test_generate_is_seeded_and_hides_answers(client):
+    query = {'technique': 'nikhilam', 'difficulty': 'intermediate', 'count': 5, 'seed': 42}
+    first = client.get('/api/practice/generate', query_string=query)
+    assert first.status_code == 200
+    body = first.get_json()
+    assert body['seed'] == 42
+    assert len(body['problems']) == 5
+    assert all('correct_answer' not in p for p in body['problems'])
+    assert client.get('/api/practice/generate', query_string=query).get_json() == body
+
+
+def test_generate_picks_a_seed_when_none_is_given(client):
+    body = client.get('/api/practice/generate', query_string={'count': 3}).get_json()
+    assert isinstance(body['seed'], int)
+    assert len(body['problems']) == 3
+
+
+@pytest.mark.parametrize('query', [
+    {'technique': 'vilokanam'},
+    {'difficulty': 'expert'},
+])
+def test_generate_rejects_unknown_params(client, query):
+    response = client.get('/api/practice/generate', query_string=query)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+@pytest.mark.parametrize('technique', sorted(vedic_generator.TECHNIQUES))
+def test_check_accepts_generated_answers(client, technique):
+    params = {'technique': technique, 'difficulty': 'beginner', 'count': 4, 'seed': 7}
+    problems = vedic_generator.generate(technique, 4, 'beginner', seed=7)
+    answers = {str(i): p.correct_answer for i, p in enumerate(problems)}
+    answers['3'] = 'not it'
+
+    response = client.post('/api/practice/check', json=dict(params, answers=answers))
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [r['isCorrect'] for r in body['results']] == [True, True, True, False]
+    assert body['correct'] == 3 and body['total'] == 4
+
+
+@pytest.mark.parametrize('payload', [
+    {'answers': {'0': '1'}},
+    {'seed': 7, 'answers': ['1']},
+    {'seed': 7, 'technique': 'vilokanam', 'answers': {'0': '1'}},
+])
+def test_check_rejects_bad_requests(client, payload):
+    response = client.post('/api/practice/check', json=payload)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
@@ -0,0 +1,73 @@
+import re
+
+import pytest
+
+import vedic_generator
+
+
+def plain_arithmetic(problem):
+    """The answer to ``problem`` worked from its question with plain arithmetic."""
+    math = re.findall(r'\$([^$]*)\$', problem.question)
+    numbers = [int(n) for n in re.findall(r'\d+', ' '.join(math))]
+    if problem.technique in ('nikhilam', 'urdhva_tiryak'):
+        a, b = numbers
+        return str(a * b)
+    if problem.technique == 'ekadhikena_square':
+        n, _ = numbers
+        return str(n * n)
+    if problem.technique == 'complement':
+        n, base = numbers
+        return str(base - n)
+    if problem.technique == 'left_to_right_addition':
+        return str(sum(numbers))
+    if problem.technique == 'digit_sum_check':
+        a, b, product = numbers
+        return 'Yes' if a * b == product else 'No'
+    raise AssertionError(f'no checker for {problem.technique}')
+
+
+@pytest.mark.parametrize('technique', sorted(vedic_generator.TECHNIQUES))
+@pytest.mark.parametrize('difficulty', vedic_generator.DIFFICULTIES)
+def test_answers_match_plain_arithmetic(technique, difficulty):
+    for problem in vedic_generator.generate(technique, 50, difficulty, seed=7):
+        assert problem.technique == technique
+        assert problem.difficulty == difficulty
+        assert problem.correct_answer == plain_arithmetic(problem)
+
+
+def test_same_seed_gives_same_problems():
+    first = vedic_generator.generate(None, 30, 'intermediate', seed=1234)
+    again = vedic_generator.generate(None, 30, 'intermediate', seed=1234)
+    assert first == again
+    assert first != vedic_generator.generate(None, 30, 'intermediate', seed=1235)
+
+
+def test_mix_draws_several_techniques():
+    problems = vedic_generator.generate(None, 60, 'beginner', seed=3)
+    assert len({p.technique for p in problems}) > 1
+
+
+def test_digit_sum_check_asks_both_ways():
+    answers = {p.correct_answer for p in vedic_generator.generate('digit_sum_check', 40, seed=5)}
+    assert answers == {'Yes', 'No'}
+
+
+@pytest.mark.parametrize('technique, difficulty', [
+    ('vilokanam', 'beginner'),
+    ('nikhilam', 'expert'),
+])
+def test_rejects_unknown_technique_or_difficulty(technique, difficulty):
+    with pytest.raises(ValueError):
+        vedic_generator.generate(technique, 1, difficulty)
+
+
+def test_payload_leaves_out_the_answer():
+    problem = vedic_generator.generate('digit_sum_check', seed=9)[0]
+    payload = vedic_generator.problem_payload(problem, 4)
+    assert payload['id'] == 4
+    assert payload['options'] == ['Yes', 'No']
+    assert 'correct_answer' not in payload and 'explanation' not in payload
+
+
+def test_digit_sum():
+    assert [vedic_generator.digit_sum(n) for n in (0, 9, 18, 123, 9875)] == [0, 9, 9, 6, 2]
@@ -0,0 +1,262 @@
+"""Procedural practice problems for the Vedic techniques we teach.
+
+Every generator draws its numbers from a ``random.Random`` passed in by
+the caller, works the problem the way the technique does, and checks
+the result against plain arithmetic before returning it, so the same
+seed always yields the same verified problems. Nothing is stored: a
+drill can be regenerated from ``(technique, difficulty, seed, count)``
+to grade it.
+"""
+import random
+from collections import namedtuple
+
+DIFFICULTIES = ('beginner', 'intermediate', 'advanced')
+
+Problem = namedtuple('Problem', [
+    'technique', 'difficulty', 'question', 'correct_answer', 'explanation',
+    'hints', 'question_type', 'options', 'tags', 'time_limit'
+])
+
+
+class GenerationError(AssertionError):
+    """A technique's working disagreed with plain arithmetic."""
+
+
+def _verify(technique, worked, expected):
+    if worked != expected:
+        raise GenerationError(f'{technique}: worked {worked}, expected {expected}')
+
+
+def _digits(n):
+    return [int(d) for d in str(n)]
+
+
+def nikhilam(rng, difficulty):
+    """Multiply two numbers near a power of 10 by their deviations from it."""
+    base, spread, mixed = {
+        'beginner': (100, 9, False),
+        'intermediate': (100, 30, True),
+        'advanced': (1000, 60, True),
+    }[difficulty]
+    da = rng.randint(1, spread) * (rng.choice((-1, 1)) if mixed else 1)
+    db = rng.randint(1, spread) * (rng.choice((-1, 1)) if mixed else 1)
+    a, b = base - da, base - db
+    left = a - db
+    right = da * db
+    worked = left * base + right
+    _verify('nikhilam', worked, a * b)
+
+    def deviation(n, d):
+        return f'{n} is {abs(d)} {"below" if d > 0 else "above"} {base}'
+
+    return Problem(
+        technique='nikhilam',
+        difficulty=difficulty,
+        question=f'Using Nikhilam (all from 9, last from 10) with base {base}, what is ${a} \\times {b}$?',
+        correct_answer=str(worked),
+        explanation=(
+            f'{deviation(a, da)} and {deviation(b, db)}. '
+            f'Cross-subtract: ${a} - ({db}) = {left}$. '
+            f'Multiply the deviations: $({da}) \\times ({db}) = {right}$. '
+            f'Combine: ${left} \\times {base} + ({right}) = {worked}$.'
+        ),
+        hints=f'Find how far each number is from {base}.',
+        question_type='calculation',
+        options=None,
+        tags='Multiplication, Nikhilam',
+        time_limit=60 if difficulty == 'beginner' else 90
+    )
+
+
+def urdhva_tiryak(rng, difficulty):
+    """Vertically and crosswise multiplication, column by column."""
+    width = {'beginner': 2, 'intermediate': 2, 'advanced': 3}[difficulty]
+    low = 10 ** (width - 1) if difficulty != 'beginner' else 11
+    high = 10 ** width - 1 if difficulty != 'beginner' else 49
+    a, b = rng.randint(low, high), rng.randint(low, high)
+    da, db = _digits(a)[::-1], _digits(b)[::-1]
+    da += [0] * (width - len(da))
+    db += [0] * (width - len(db))
+
+    columns = []
+    for k in range(2 * width - 1):
+        columns.append(sum(da[i] * db[k - i] for i in range(width) if 0 <= k - i < width))
+    steps, carry, digits = [], 0, []
+    for k, column in enumerate(columns):
+        total = column + carry
+        digits.append(total % 10)
+        steps.append(f'column {k + 1}: {column}' + (f' + carry {carry}' if carry else '') + f' = {total}')
+        carry = total // 10
+    worked = carry * 10 ** len(digits) + sum(d * 10 ** k for k, d in enumerate(digits))
+    _verify('urdhva_tiryak', worked, a * b)
+
+    return Problem(
+        technique='urdhva_tiryak',
+        difficulty=difficulty,
+        question=f'Using Urdhva-Tiryak (vertically and crosswise), what is ${a} \\times {b}$?',
+        correct_answer=str(worked),
+        explanation='Working right to left, ' + '; '.join(steps) +
+                    f'. Write each last digit and carry the rest: {worked}.',
+        hints='Multiply vertically at the ends and crosswise in the middle, carrying as you go.',
+        question_type='calculation',
+        options=None,
+        tags='Multiplication, Urdhva-Tiryak',
+        time_limit={'beginner': 60, 'intermediate': 90, 'advanced': 150}[difficulty]
+    )
+
+
+def ekadhikena_square(rng, difficulty):
+    """Square a number ending in 5: n x (n + 1), then append 25."""
+    low, high = {'beginner': (1, 9), 'intermediate': (10, 29), 'advanced': (30, 199)}[difficulty]
+    k = rng.randint(low, high)
+    n = 10 * k + 5
+    head = k * (k + 1)
+    worked = int(f'{head}25')
+    _verify('ekadhikena_square', worked, n * n)
+
+    return Problem(
+        technique='ekadhikena_square',
+        difficulty=difficulty,
+        question=f'Using Ekadhikena Purvena, what is ${n}^2$?',
+        correct_answer=str(worked),
+        explanation=f'Multiply {k} by one more than itself: ${k} \\times {k + 1} = {head}$. '
+                    f'Append 25: {worked}.',
+        hints='Take the digits before the 5 and multiply by the next number up.',
+        question_type='calculation',
+        options=None,
+        tags='Squares, Ekadhikena',
+        time_limit=30 if difficulty == 'beginner' else 60
+    )
+
+
+def complement(rng, difficulty):
+    """Complement from a power of 10: all from 9 and the last from 10."""
+    width = {'beginner': 2, 'intermediate': 3, 'advanced': rng.randint(4, 6)}[difficulty]
+    base = 10 ** width
+    n = rng.randint(10 ** (width - 1), base - 1)
+    digits = _digits(n)
+    zeros = len(digits) - len(str(n).rstrip('0'))
+    significant = digits[:len(digits) - zeros]
+    worked_digits = [9 - d for d in significant[:-1]] + [10 - significant[-1]] + [0] * zeros
+    worked = int(''.join(str(d) for d in worked_digits))
+    _verify('complement', worked, base - n)
+
+    trailing = ' Trailing zeros stay as zeros.' if zeros else ''
+    return Problem(
+        technique='complement',
+        difficulty=difficulty,
+        question=f'Using "All from 9 and the Last from 10", what is the complement of ${n}$ from ${base}$?',
+        correct_answer=str(worked),
+        explanation=f'Subtract each digit of {n} from 9 except the last non-zero digit, '
+                    f'which comes from 10.{trailing} Result: {worked}.',
+        hints='Work digit by digit; only the last non-zero digit is taken from 10.',
+        question_type='calculation',
+        options=None,
+        tags='Subtraction, Complement, Nikhilam',
+        time_limit=30 if difficulty == 'beginner' else 45
+    )
+
+
+def left_to_right_addition(rng, difficulty):
+    """Add column by column starting from the largest place value."""
+    terms, width = {'beginner': (2, 2), 'intermediate': (2, 3), 'advanced': (3, 4)}[difficulty]
+    numbers = [rng.randint(10 ** (width - 1), 10 ** width - 1) for _ in range(terms)]
+    running, steps = 0, []
+    for place in range(width - 1, -1, -1):
+        unit = 10 ** place
+        part = sum((n // unit) % 10 for n in numbers) * unit
+        running += part
+        steps.append(f'{part} (running total {running})')
+    _verify('left_to_right_addition', running, sum(numbers))
+
+    expression = ' + '.join(str(n) for n in numbers)
+    return Problem(
+        technique='left_to_right_addition',
+        difficulty=difficulty,
+        question=f'Using Left-to-Right Addition, what is ${expression}$?',
+        correct_answer=str(running),
+        explanation='Add each place value from the left: ' + ', then '.join(steps) + '.',
+        hints='Accumulate the sum mentally from left to right, column by column.',
+        question_type='calculation',
+        options=None,
+        tags='Addition, Left-to-Right',
+        time_limit=45 if difficulty == 'beginner' else 60
+    )
+
+
+def digit_sum(n):
+    """Repeated digit sum (the number's remainder mod 9, with 9 for 0)."""
+    return 9 if n and n % 9 == 0 else n % 9
+
+
+def digit_sum_check(rng, difficulty):
+    """Decide whether a product is right by casting out nines."""
+    low, high = {'beginner': (11, 99), 'intermediate': (100, 999), 'advanced': (1000, 9999)}[difficulty]
+    a, b = rng.randint(low, high), rng.randint(low, high)
+    product = a * b
+    is_correct = rng.random() < 0.5
+    if not is_correct:
+        # Errors that are multiples of 9 slip past the check, so avoid them
+        error = rng.choice([e for e in range(-8, 9) if e % 9])
+        product += error * 10 ** rng.randint(0, len(str(product)) - 2)
+    check = digit_sum(digit_sum(a) * digit_sum(b))
+    passes = check == digit_sum(product)
+    _verify('digit_sum_check', passes, is_correct)
+
+    answer = 'Yes' if passes else 'No'
+    return Problem(
+        technique='digit_sum_check',
+        difficulty=difficulty,
+        question=f'Using the digit-sum check, is ${a} \\times {b} = {product}$ correct?',
+        correct_answer=answer,
+        explanation=f'Digit sums: {a} -> {digit_sum(a)}, {b} -> {digit_sum(b)}; '
+                    f'their product reduces to {check}. {product} reduces to {digit_sum(product)}, '
+                    f'so the answer is {"consistent" if passes else "wrong"}.',
+        hints='Reduce each number to a single digit, multiply those, and compare.',
+        question_type='multiple_choice',
+        options='Yes\nNo',
+        tags='Multiplication, Digit Sum, Verification',
+        time_limit=45
+    )
+
+
+TECHNIQUES = {
+    'nikhilam': nikhilam,
+    'urdhva_tiryak': urdhva_tiryak,
+    'ekadhikena_square': ekadhikena_square,
+    'complement': complement,
+    'left_to_right_addition': left_to_right_addition,
+    'digit_sum_check': digit_sum_check,
+}
+
+
+def generate(technique, count=1, difficulty='beginner', seed=None):
+    """Generate ``count`` problems; ``technique`` may be None for a mix.
+
+    The same arguments with the same ``seed`` give the same problems.
+    """
+    if technique is not None and technique not in TECHNIQUES:
+        raise ValueError(f'Unknown technique: {technique}')
+    if difficulty not in DIFFICULTIES:
+        raise ValueError(f'Unknown difficulty: {difficulty}')
+    rng = random.Random(seed)
+    names = sorted(TECHNIQUES)
+    return [
+        TECHNIQUES[technique or rng.choice(names)](rng, difficulty)
+        for _ in range(count)
+    ]
+
+
+def problem_payload(problem, index):
+    """Drill payload for a generated problem, without the answer."""
+    return {
+        'id': index,
+        'technique': problem.technique,
+        'question': problem.question,
+        'difficulty': problem.difficulty,
+        'question_type': problem.question_type,
+        'options': problem.options.split('\n') if problem.options else [],
+        'hints': problem.hints,
+        'time_limit': problem.time_limit,
+        'tags': problem.tags
+    }
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import {
   Trophy, Lock, CheckCircle, Play, Timer, ChevronLeft, RotateCcw,
   Award, Target, Clock, CheckCircle2, XCircle, AlertCircle
@@ -11,8 +11,11 @@ export default function QuizInterface() {
   const [selectedQuiz, setSelectedQuiz] = useState(null);
   const [currentQuestionIndex, setCurrentQuestionIndex] = useState(0);
   const [answers, setAnswers] = useState({});
+  // Latest answers for the timer's auto-submit, which runs from a stale closure
+  const answersRef = useRef({});
   const [timeRemaining, setTimeRemaining] = useState(null);
   const [quizStartTime, setQuizStartTime] = useState(null);
+  const [attemptToken, setAttemptToken] = useState(null);
   const [quizResults, setQuizResults] = useState(null);
 
   useEffect(() => {
@@ -56,6 +59,15 @@ export default function QuizInterface() {
   const startQuiz = async (quiz) => {
     try {
       const token = localStorage.getItem("token");
+      const startRes = await fetch(`http://localhost:5000/api/quiz/${quiz.id}/start`, {
+        method: 'POST',
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      const attempt = await startRes.json();
+      if (!startRes.ok) {
+        alert(attempt.error || 'Unable to start quiz');
+        return;
+      }
       const res = await fetch(`http://localhost:5000/api/quiz/${quiz.id}/questions`, {
         headers: { Authorization: `Bearer ${token}` }
       });
@@ -63,8 +75,10 @@ export default function QuizInterface() {
       setQuestions(data);
       setSelectedQuiz(quiz);
       setCurrentQuestionIndex(0);
+      answersRef.current = {};
       setAnswers({});
-      setTimeRemaining(quiz.time_limit * 60 || quiz.timeLimit * 60 || 600); // default to 10 min
+      setAttemptToken(attempt.attempt_token);
+      setTimeRemaining(attempt.time_limit * 60); // time_limit is in minutes
       setQuizStartTime(Date.now());
       setCurrentView('quiz');
     } catch (error) {
@@ -73,10 +87,11 @@ export default function QuizInterface() {
   };
 
   const handleAnswerSelect = (questionId, answer) => {
-    setAnswers(prev => ({
-      ...prev,
+    answersRef.current = {
+      ...answersRef.current,
       [questionId]: answer
-    }));
+    };
+    setAnswers(answersRef.current);
   };
 
   const handleSaveAndNext = () => {
@@ -88,6 +103,10 @@ export default function QuizInterface() {
       const inputElement = document.querySelector('input[type="text"]');
       if (inputElement && inputElement.value.trim()) {
         handleAnswerSelect(currentQuestion.id, inputElement.value.trim());
+        if (currentQuestionIndex === questions.length - 1) {
+          handleSubmitQuiz();
+          return;
+        }
       }
     }
     
@@ -99,45 +118,40 @@ export default function QuizInterface() {
     }
   };
 
-  const handleSubmitQuiz = () => {
-    const endTime = Date.now();
-    const timeTaken = Math.floor((endTime - quizStartTime) / 1000);
-
-    let correctAnswers = 0;
-    const questionResults = questions.map(question => {
-      const userAnswer = answers[question.id];
-      const correct = String(userAnswer).trim().toLowerCase() === String(question.correct_answer).trim().toLowerCase();
-      if (correct) correctAnswers++;
-      return {
-        ...question,
-        userAnswer,
-        isCorrect: correct
-      };
-    });
-
-    const totalQuestions = questions.length;
-    const score = Math.round((correctAnswers / totalQuestions) * 100);
-    const isPassed = score >= selectedQuiz.passingScore;
-
-    setQuizResults({
-      score,
-      correctAnswers,
-      totalQuestions,
-      timeTaken,
-      isPassed,
-      questionResults
-    });
-
-    setCurrentView('results');
+  const handleSubmitQuiz = async (finalAnswers = answersRef.current) => {
+    // Grading happens on the server; questions carry no answers
+    try {
+      const token = localStorage.getItem("token");
+      const res = await fetch(`http://localhost:5000/api/quiz/${selectedQuiz.id}/submit`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          Authorization: `Bearer ${token}`
+        },
+        body: JSON.stringify({ answers: finalAnswers, attempt_token: attemptToken })
+      });
+      const data = await res.json();
+      if (!res.ok) {
+        alert(data.error || 'Failed to submit quiz');
+        resetQuiz();
+        return;
+      }
+      setQuizResults(data);
+      setCurrentView('results');
+    } catch (error) {
+      console.error("Failed to submit quiz:", error);
+    }
   };
 
   const resetQuiz = () => {
     setCurrentView('challenges');
     setSelectedQuiz(null);
     setCurrentQuestionIndex(0);
+    answersRef.current = {};
     setAnswers({});
     setTimeRemaining(null);
     setQuizStartTime(null);
+    setAttemptToken(null);
     setQuizResults(null);
     setQuestions([]);
   };
@@ -184,7 +198,7 @@ export default function QuizInterface() {
                 </div>
                 <div className="flex justify-between">
                   <span className="text-gray-600">Time Limit</span>
-                  <span className="font-medium">{Math.floor((quiz.time_limit || quiz.timeLimit || 600) / 60)} minutes</span>
+                  <span className="font-medium">{quiz.timeLimit || quiz.time_limit || 10} minutes</span>
                 </div>
                 <div className="flex justify-between">
                   <span className="text-gray-600">XP Reward</span>
@@ -40,7 +40,7 @@ const ChatBot = () => {
     // ✅ Get token from localStorage (after login)
     const token = localStorage.getItem('token');
 
-    const response = await fetch('/api/chat', {
+    const response = await fetch('/api/chat/stream', {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -62,16 +62,38 @@ const ChatBot = () => {
       throw new Error('Failed to get response from chatbot');
     }
 
-    const data = await response.json();
+    // ✅ Show the reply as it streams in (Server-Sent Events frames)
+    const botId = Date.now() + 1;
+    setMessages(prev => [...prev, { id: botId, text: '', sender: 'bot', timestamp: new Date() }]);
+    setIsTyping(false);
 
-    const botResponse = {
-      id: Date.now() + 1,
-      text: data.reply || "I'm sorry, I couldn't process that request. Please try again.",
-      sender: 'bot',
-      timestamp: new Date()
-    };
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let reply = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const frames = buffer.split('\n\n');
+      buffer = frames.pop();
+      for (const frame of frames) {
+        const dataLine = frame.split('\n').find(line => line.startsWith('data: '));
+        if (!dataLine) continue;
+        const payload = JSON.parse(dataLine.slice(6));
+        if (payload.error) throw new Error(payload.error);
+        if (payload.text) {
+          reply += payload.text;
+          const text = reply;
+          setMessages(prev => prev.map(msg => (msg.id === botId ? { ...msg, text } : msg)));
+        }
+      }
+    }
 
-    setMessages(prev => [...prev, botResponse]);
+    if (!reply) {
+      const text = "I'm sorry, I couldn't process that request. Please try again.";
+      setMessages(prev => prev.map(msg => (msg.id === botId ? { ...msg, text } : msg)));
+    }
   } catch (error) {
     console.error('Error calling chat API:', error);
 
@@ -274,7 +296,7 @@ export default function DashboardTab({ user, units, stats, setActiveTab }) {
               <div className="w-32 bg-white/30 rounded-full h-2 mt-2">
                 <div
                   className="bg-white h-2 rounded-full transition-all duration-300"
-                  style={{ width: `${(user?.xp / (user?.xp + user?.xpToNextLevel)) * 100}%` }}
+                  style={{ width: `${user?.levelProgress ?? 0}%` }}
                 />
               </div>
               <p className="text-xs text-blue-100 mt-1">{user?.xpToNextLevel} XP to next level</p>
@@ -103,13 +103,12 @@ export default function VedicLessonPage() {
     const fetchUnit = async () => {
       try {
         const token = localStorage.getItem('token');
-        const res = await fetch(`http://localhost:5000/api/units`, {
+        const res = await fetch(`http://localhost:5000/api/units/${unitId}`, {
           headers: {
             Authorization: `Bearer ${token}`
           }
         });
-        const allUnits = await res.json();
-        const foundUnit = allUnits.find((u) => u.id.toString() === unitId);
+        const foundUnit = res.ok ? await res.json() : undefined;
         setUnit(foundUnit);
       } catch (error) {
         console.error('Error fetching unit:', error);
@@ -86,14 +86,17 @@ export default function ProgressTab({ user, stats }) {
       <div className="bg-white rounded-xl shadow-lg p-6">
         <h3 className="text-lg font-semibold text-gray-800 mb-4">Weekly Activity</h3>
         <div className="flex items-end space-x-2 h-40">
-          {stats.weeklyProgress?.map((score, index) => (
+          {stats.weeklyProgress?.map((xp, index) => (
             <div key={index} className="flex-1 flex flex-col items-center">
               <div
                 className="w-full bg-purple-500 rounded-t-lg transition-all duration-300 hover:bg-purple-600"
-                style={{ height: `${(score / 100) * 120}px` }}
+                style={{ height: `${(xp / Math.max(...stats.weeklyProgress, 1)) * 120}px` }}
+                title={`${xp} XP`}
               />
               <span className="text-xs text-gray-600 mt-2">
-                {['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'][index]}
+                {stats.weeklyDates
+                  ? new Date(`${stats.weeklyDates[index]}T00:00:00`).toLocaleDateString(undefined, { weekday: 'short' })
+                  : ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'][index]}
               </span>
             </div>
           ))}
@@ -8,6 +8,7 @@ export default function QuickDrillModal({ onClose }) {
   const [timeLeft, setTimeLeft] = useState(120); // 2 minutes in seconds
   const [answers, setAnswers] = useState([]);
   const [isFinished, setIsFinished] = useState(false);
+  const [score, setScore] = useState({ total: 0, correct: 0, percentage: 0 });
 
   useEffect(() => {
     // Fetch questions from backend
@@ -31,23 +32,37 @@ export default function QuickDrillModal({ onClose }) {
     }
   }, [timeLeft, isFinished]);
 
+  useEffect(() => {
+    // Drill questions carry no answers; check them all once time is up
+    if (!isFinished || answers.length === 0) return;
+    fetch('http://localhost:5000/api/exercises/check', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'Authorization': `Bearer ${localStorage.getItem('token')}`
+      },
+      body: JSON.stringify({
+        answers: Object.fromEntries(answers.map(a => [a.question.id, a.answer]))
+      })
+    })
+      .then(res => res.json())
+      .then(data => setScore({
+        total: data.total,
+        correct: data.correct,
+        percentage: data.total ? Math.round((data.correct / data.total) * 100) : 0
+      }));
+  }, [isFinished]);
+
   const handleSubmit = (e) => {
     e.preventDefault();
-    const isCorrect = answer === questions[currentQuestion].correct_answer;
-    setAnswers([...answers, { question: questions[currentQuestion], answer, isCorrect }]);
+    setAnswers([...answers, { question: questions[currentQuestion], answer }]);
     setAnswer('');
+    if (currentQuestion === questions.length - 1) {
+      setIsFinished(true);
+    }
     setCurrentQuestion(prev => prev + 1);
   };
 
-  const getScore = () => {
-    const correct = answers.filter(a => a.isCorrect).length;
-    return {
-      total: answers.length,
-      correct,
-      percentage: Math.round((correct / answers.length) * 100)
-    };
-  };
-
   return (
     <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
       <div className="bg-white rounded-xl p-6 w-full max-w-lg mx-4">
@@ -96,14 +111,14 @@ export default function QuickDrillModal({ onClose }) {
           <div className="text-center">
             <h4 className="text-xl font-bold mb-4">Time's Up!</h4>
             <div className="space-y-4">
-              <div className="text-4xl font-bold text-blue-600">{getScore().percentage}%</div>
+              <div className="text-4xl font-bold text-blue-600">{score.percentage}%</div>
               <div className="flex justify-center space-x-8">
                 <div>
-                  <div className="text-2xl font-bold text-green-600">{getScore().correct}</div>
+                  <div className="text-2xl font-bold text-green-600">{score.correct}</div>
                   <div className="text-sm text-gray-600">Correct</div>
                 </div>
                 <div>
-                  <div className="text-2xl font-bold text-gray-600">{getScore().total}</div>
+                  <div className="text-2xl font-bold text-gray-600">{score.total}</div>
                   <div className="text-sm text-gray-600">Total</div>
                 </div>
               </div>
@@ -60,21 +60,14 @@ const AdminDashboard = () => {
  const fetchData = async () => {
     setLoading(true);
     try {
-      const [statsData, usersData, lessonsData, questionsData, unitsData , quizzesData] = await Promise.all([
-        apiCall('/api/admin/stats'),
-        apiCall('/api/admin/users'),
-        apiCall('/api/admin/lessons'),
-        apiCall('/api/admin/questions'),
-        apiCall('/api/admin/units'),
-        apiCall('/api/admin/quizzes')
-      ]);
-
-      setStats(statsData);
-      setUsers(usersData.users || []);
-      setLessons(lessonsData.lessons || []);
-      setQuestions(questionsData.questions || []);
-      setUnits(unitsData.units || []);
-      setQuizzes(quizzesData.quizzes || []);
+      const data = await apiCall('/api/admin/bootstrap');
+
+      setStats(data.stats);
+      setUsers(data.users || []);
+      setLessons(data.lessons || []);
+      setQuestions(data.questions || []);
+      setUnits(data.units || []);
+      setQuizzes(data.quizzes || []);
     } catch (error) {
       console.error('Error fetching data:', error);
     } finally {
@@ -816,6 +809,8 @@ const QuestionManagement = () => (
               <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Max Attempts</th>
               <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Passing Score</th>
               <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">XP Reward</th>
+              <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Participants</th>
+              <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Pass Rate</th>
               <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Actions</th>
             </tr>
           </thead>
@@ -832,6 +827,11 @@ const QuestionManagement = () => (
                 <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{quiz.max_attempts}</td>
                 <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{quiz.passing_score}%</td>
                 <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{quiz.xp_reward} XP</td>
+                <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
+                  {quiz.stats?.participants ?? 0}
+                  <span className="text-gray-500"> ({quiz.stats?.attempts ?? 0} attempts)</span>
+                </td>
+                <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">{quiz.stats?.pass_rate ?? 0}%</td>
                 <td className="px-6 py-4 whitespace-nowrap text-sm font-medium">
   <div className="flex space-x-2">
     <button
@@ -15,10 +15,12 @@ export default function Auth() {
 
   const handleSubmit = async () => {
     try {
+      // Minutes east of UTC, so streaks roll over at the learner's midnight
+      const utcOffsetMinutes = -new Date().getTimezoneOffset();
       const endpoint = isSignUp ? 'http://localhost:5000/api/register' : 'http://localhost:5000/api/login';
       const payload = isSignUp 
-        ? { username, email, password, confirmPassword, date_of_birth: dateOfBirth, grade_qualification: gradeQualification }
-        : { username, password };
+        ? { username, email, password, confirmPassword, date_of_birth: dateOfBirth, grade_qualification: gradeQualification, utc_offset_minutes: utcOffsetMinutes }
+        : { username, password, utc_offset_minutes: utcOffsetMinutes };
 
       const response = await fetch(endpoint, {
         method: 'POST',
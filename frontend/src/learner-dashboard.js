@@ -48,21 +48,14 @@ export default function LearnerDashboard() {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [userRes, unitsRes, lessonsRes, challengesRes, statsRes, notifsRes] = await Promise.all([
-          apiCall('/api/user/me'),
-          apiCall('/api/units'),
-          apiCall('/api/lessons'),
-          apiCall('/api/challenges'),
-          apiCall('/api/user/stats')
-        ]);
-
-        setUser(userRes);
-        setEditedUser(userRes);
-        setUnits(unitsRes);
-        setLessons(lessonsRes);
-        setChallenges(challengesRes);
-        setStats(statsRes);
-        setNotifications(notifsRes);
+        const data = await apiCall('/api/bootstrap');
+
+        setUser(data.user);
+        setEditedUser(data.user);
+        setUnits(data.units);
+        setLessons(data.lessons);
+        setChallenges(data.challenges);
+        setStats(data.stats);
       } catch (error) {
         console.error('Error loading dashboard data:', error);
       } finally {